@@ -4,18 +4,32 @@ Duplicate video detection using perceptual hashing
 
 import cv2
 import imagehash
+import numpy as np
 import re
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
 from collections import defaultdict
 from ui import console, create_scan_progress
 
 
+# Set bits in every byte value, for NumPy releases without np.bitwise_count (< 2.0)
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """Per-byte population count of a uint8 array"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values)
+    return _POPCOUNT_TABLE[values]
+
+
 class DuplicateDetector:
     """Detects duplicate videos using perceptual hashing of video frames"""
 
-    def __init__(self, hash_size: int = 12, threshold: int = 15, num_samples: int = 10, verbose: bool = False):
+    def __init__(self, hash_size: int = 12, threshold: int = 15, num_samples: int = 10, verbose: bool = False,
+                 workers: int = 1, hw_decode: bool = False):
         """
         Initialize duplicate detector
 
@@ -24,11 +38,33 @@ class DuplicateDetector:
             threshold: Average Hamming distance threshold for considering videos similar (default: 15)
             num_samples: Number of frames to sample from each video (default: 10)
             verbose: Enable verbose output
+            workers: Number of processes used to hash videos (default: 1 = in-process)
+            hw_decode: Ask OpenCV for hardware-accelerated decoding (VA-API, NVDEC,
+                      VideoToolbox...); files it can't decode that way fall back to software
         """
         self.hash_size = hash_size
         self.threshold = threshold
         self.num_samples = num_samples
         self.verbose = verbose
+        self.workers = max(1, workers)
+        self.hw_decode = hw_decode
+
+    def _open_capture(self, video_path: Path, hw_decode: bool) -> cv2.VideoCapture:
+        """
+        Open a video for frame reads, with hardware decoding if requested
+
+        OpenCV builds without the hardware-acceleration properties (< 4.5.2)
+        always get a software decoder.
+        """
+        if hw_decode and hasattr(cv2, 'CAP_PROP_HW_ACCELERATION'):
+            cap = cv2.VideoCapture(
+                str(video_path), cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+            )
+            if cap.isOpened():
+                return cap
+            cap.release()
+        return cv2.VideoCapture(str(video_path))
 
     def extract_frame(self, video_path: Path, frame_number: int = 0) -> Image.Image:
         """
@@ -85,21 +121,25 @@ class DuplicateDetector:
                 print(f"Error extracting frame from {video_path}: {e}")
             return None
 
-    def extract_multiple_frames(self, video_path: Path, num_frames: int = 3) -> List[Image.Image]:
+    def extract_multiple_frames(self, video_path: Path, num_frames: int = 3,
+                                hw_decode: Optional[bool] = None) -> List[Image.Image]:
         """
         Extract multiple frames evenly distributed throughout the video
 
         Args:
             video_path: Path to video file
             num_frames: Number of frames to extract
+            hw_decode: Override the detector's hw_decode setting
 
         Returns:
             List of PIL Image objects
         """
+        if hw_decode is None:
+            hw_decode = self.hw_decode
         frames = []
 
         try:
-            cap = cv2.VideoCapture(str(video_path))
+            cap = self._open_capture(video_path, hw_decode)
 
             if not cap.isOpened():
                 return frames
@@ -131,6 +171,11 @@ class DuplicateDetector:
             if self.verbose:
                 print(f"Error extracting frames from {video_path}: {e}")
 
+        # Hardware decoders can open a file yet fail to decode it (unsupported
+        # profile or bit depth); retry that file in software
+        if hw_decode and not frames:
+            return self.extract_multiple_frames(video_path, num_frames, hw_decode=False)
+
         return frames
 
     def compute_video_hash(self, video_path: Path) -> List[imagehash.ImageHash]:
@@ -168,69 +213,225 @@ class DuplicateDetector:
                 console.print(f"[error]Error computing hash for {video_path}: {e}[/error]")
             return None
 
-    def find_duplicates(self, video_paths: List[Path]) -> Tuple[Dict[str, List[Path]], List[Path]]:
+    def _packed_video_hash(self, video_path: Path) -> Optional[np.ndarray]:
+        """
+        Compute a video's frame hashes packed as a (frames, bytes) uint8 array
+
+        This is what hashing workers send back: one small contiguous buffer per
+        video pickles far cheaper than a list of ImageHash objects, each of
+        which carries its own bool array of hash_size² bytes.
+
+        Args:
+            video_path: Path to video file
+
+        Returns:
+            Packed hash bits, one row per sampled frame, or None if hashing fails
+        """
+        hashes = self.compute_video_hash(video_path)
+        if not hashes:
+            return None
+        bits = np.stack([h.hash.reshape(-1) for h in hashes])
+        return np.packbits(bits, axis=1)
+
+    def find_duplicates(
+        self,
+        video_paths: List[Path],
+        durations: Optional[Dict[Path, float]] = None,
+        duration_tolerance: float = 2.0
+    ) -> Tuple[Dict[str, List[Path]], List[Path]]:
         """
         Find duplicate videos in a list using multi-frame perceptual hashing
 
         Args:
             video_paths: List of video file paths
+            durations: Optional known durations in seconds. Frames are sampled at
+                       evenly spaced positions, so videos of different lengths
+                       can't match; when given, videos whose duration no other
+                       video shares (within duration_tolerance) are not hashed,
+                       and pairs with mismatched durations are not compared.
+                       Videos with an unknown or zero duration are always hashed.
+            duration_tolerance: Maximum duration difference in seconds (default: 2.0)
 
         Returns:
             Tuple containing:
             - Dictionary mapping group IDs to lists of duplicate video paths
             - List of video paths that failed hashing (potential corruption/issues)
         """
+        if durations:
+            candidates = self._duration_candidates(video_paths, durations, duration_tolerance)
+            skipped = len(video_paths) - len(candidates)
+            if skipped:
+                console.print(f"Skipping {skipped} videos with no duration match")
+            video_paths = candidates
+
         # Compute hashes for all videos
-        video_hashes: Dict[Path, List[imagehash.ImageHash]] = {}
+        video_hashes: Dict[Path, np.ndarray] = {}
         failed_videos: List[Path] = []
 
-        with create_scan_progress() as progress:
-            task = progress.add_task("Computing hashes", total=len(video_paths))
-            for video_path in video_paths:
-                hash_list = self.compute_video_hash(video_path)
-                if hash_list is not None:
-                    video_hashes[video_path] = hash_list
-                else:
-                    failed_videos.append(video_path)
-                progress.advance(task)
+        # Frame decoding and pHash are CPU-bound Python/C work, so hash in
+        # separate processes. The pool is started before the progress display
+        # so no refresh thread is running when the workers fork.
+        executor = None
+        workers = min(self.workers, len(video_paths))
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            chunksize = max(1, min(8, len(video_paths) // (workers * 4)))
+            results = executor.map(self._packed_video_hash, video_paths, chunksize=chunksize)
+        else:
+            results = map(self._packed_video_hash, video_paths)
+
+        try:
+            with create_scan_progress() as progress:
+                task = progress.add_task("Computing hashes", total=len(video_paths))
+                for video_path, hash_list in zip(video_paths, results):
+                    if hash_list is not None:
+                        video_hashes[video_path] = hash_list
+                    else:
+                        failed_videos.append(video_path)
+                    progress.advance(task)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
         console.print(f"Successfully hashed {len(video_hashes)} videos")
         if failed_videos:
             console.print(f"[warning]Failed to hash {len(failed_videos)} videos[/warning]")
 
         # Find similar videos based on average hash distance across frames
-        duplicate_groups: Dict[str, List[Path]] = {}
-        processed: Set[Path] = set()
-        group_id = 0
-
         video_list = list(video_hashes.keys())
+        groups = self._group_similar_hashes(
+            [video_hashes[video] for video in video_list],
+            [durations.get(video, 0) for video in video_list] if durations else None,
+            duration_tolerance
+        )
+        duplicate_groups: Dict[str, List[Path]] = {
+            f"group_{group_id}": [video_list[k] for k in members]
+            for group_id, members in enumerate(groups)
+        }
 
-        for i, video1 in enumerate(video_list):
-            if video1 in processed:
-                continue
+        return duplicate_groups, failed_videos
 
-            # Start a new group
-            current_group = [video1]
-            processed.add(video1)
+    def _group_similar_hashes(
+        self,
+        packed_hashes: List[np.ndarray],
+        durations: Optional[List[float]],
+        duration_tolerance: float
+    ) -> List[List[int]]:
+        """
+        Greedily group videos whose average frame-hash distance is within threshold
 
-            # Compare with all remaining videos
-            for video2 in video_list[i + 1:]:
-                if video2 in processed:
-                    continue
+        Each ungrouped video, in order, seeds a group and claims every later
+        ungrouped video within threshold of it. The seed is compared against all
+        remaining candidates in one XOR + popcount over a (videos, frames, bytes)
+        matrix rather than one Python-level comparison per pair.
+
+        Args:
+            packed_hashes: Hashes from _packed_video_hash, one entry per video
+            durations: Optional durations aligned with packed_hashes (0 = unknown);
+                       pairs whose known durations differ by more than
+                       duration_tolerance are never grouped
+            duration_tolerance: Maximum duration difference in seconds
+
+        Returns:
+            Groups of 2+ indices into packed_hashes, each in ascending order
+        """
+        count = len(packed_hashes)
+        if count < 2:
+            return []
+
+        # Videos shorter than num_samples yield fewer frames; pad with zeros and
+        # only ever sum over the frames both videos have
+        max_frames = max(len(packed) for packed in packed_hashes)
+        matrix = np.zeros((count, max_frames, packed_hashes[0].shape[1]), dtype=np.uint8)
+        frame_counts = np.empty(count, dtype=np.intp)
+        for k, packed in enumerate(packed_hashes):
+            matrix[k, :len(packed)] = packed
+            frame_counts[k] = len(packed)
+        # Duration index: a seed's candidates are a searchsorted window over
+        # the sorted durations plus the unknown-duration videos, instead of a
+        # scan over every remaining video
+        duration_array = None
+        if durations:
+            duration_array = np.asarray(durations, dtype=float)
+            by_duration = np.argsort(duration_array, kind='stable')
+            sorted_durations = duration_array[by_duration]
+            unknown_duration = np.flatnonzero(duration_array <= 0)
+
+        ungrouped = np.ones(count, dtype=bool)
+        groups: List[List[int]] = []
+        for seed in range(count):
+            if not ungrouped[seed]:
+                continue
+            ungrouped[seed] = False
+
+            if duration_array is not None and duration_array[seed] > 0:
+                seed_duration = duration_array[seed]
+                # Widen slightly for float rounding, then apply the exact check
+                lo = np.searchsorted(sorted_durations, seed_duration - duration_tolerance - 1e-9, 'left')
+                hi = np.searchsorted(sorted_durations, seed_duration + duration_tolerance + 1e-9, 'right')
+                window = by_duration[lo:hi]
+                other = duration_array[window]
+                window = window[(other > 0) & (np.abs(other - seed_duration) <= duration_tolerance)]
+                candidates = np.union1d(window, unknown_duration)
+                candidates = candidates[candidates > seed]
+                candidates = candidates[ungrouped[candidates]]
+            else:
+                candidates = seed + 1 + np.flatnonzero(ungrouped[seed + 1:])
+            if candidates.size == 0:
+                continue
 
-                # Calculate average Hamming distance across all frame pairs
-                distance = self._compare_video_hashes(video_hashes[video1], video_hashes[video2])
+            distances = self._hash_distances(matrix, frame_counts, seed, candidates)
+            matched = candidates[distances <= self.threshold]
+            if matched.size:
+                ungrouped[matched] = False
+                groups.append([seed, *matched.tolist()])
+
+        return groups
+
+    @staticmethod
+    def _hash_distances(
+        matrix: np.ndarray,
+        frame_counts: np.ndarray,
+        seed: int,
+        candidates: np.ndarray
+    ) -> np.ndarray:
+        """
+        Average Hamming distance from one video to many, over shared frames
 
-                if distance >= 0 and distance <= self.threshold:
-                    current_group.append(video2)
-                    processed.add(video2)
+        Vectorized _compare_video_hashes: per-frame bit differences are summed
+        cumulatively so each pair can be cut at min(frames1, frames2).
+        """
+        per_frame = _popcount(matrix[candidates] ^ matrix[seed]).sum(axis=2, dtype=np.int64)
+        shared = np.minimum(frame_counts[candidates], frame_counts[seed])
+        totals = per_frame.cumsum(axis=1)[np.arange(candidates.size), shared - 1]
+        return totals / shared
 
-            # Only save groups with duplicates (2+ videos)
-            if len(current_group) > 1:
-                duplicate_groups[f"group_{group_id}"] = current_group
-                group_id += 1
+    @staticmethod
+    def _duration_candidates(
+        video_paths: List[Path],
+        durations: Dict[Path, float],
+        tolerance: float
+    ) -> List[Path]:
+        """
+        Keep videos that could have a duplicate based on duration alone
 
-        return duplicate_groups, failed_videos
+        Sorting by duration means a video has a partner within tolerance only if
+        one of its sorted neighbours is within tolerance, so this is O(N log N).
+        Input order is preserved in the result.
+        """
+        known = sorted(
+            (durations[path], path) for path in video_paths
+            if durations.get(path, 0) > 0
+        )
+        matched: Set[Path] = set()
+        for (d1, p1), (d2, p2) in zip(known, known[1:]):
+            if d2 - d1 <= tolerance:
+                matched.add(p1)
+                matched.add(p2)
+        return [
+            path for path in video_paths
+            if path in matched or durations.get(path, 0) <= 0
+        ]
 
     def _compare_video_hashes(
         self,
@@ -293,7 +494,8 @@ class DuplicateDetector:
         video_paths: List[Path],
         analyzer=None,
         check_duration: bool = True,
-        duration_tolerance: float = 2.0
+        duration_tolerance: float = 2.0,
+        video_infos: Optional[Dict] = None
     ) -> Dict[str, List[Path]]:
         """
         Find duplicate videos based on filename matching (ignoring extension and common suffixes)
@@ -308,6 +510,8 @@ class DuplicateDetector:
             analyzer: Optional VideoAnalyzer instance for duration checking
             check_duration: If True and analyzer provided, verify durations match (default: True)
             duration_tolerance: Maximum duration difference in seconds (default: 2.0)
+            video_infos: Optional dict of already-probed VideoInfo by path; videos
+                        missing from it are probed and added to it
 
         Returns:
             Dictionary mapping group IDs to lists of duplicate video paths
@@ -388,7 +592,11 @@ class DuplicateDetector:
                     # Get video info for all files in group
                     video_info_map = {}
                     for video in videos:
-                        info = analyzer.get_video_info(video)
+                        info = video_infos.get(video) if video_infos is not None else None
+                        if info is None:
+                            info = analyzer.get_video_info(video)
+                            if video_infos is not None and info and info.is_valid:
+                                video_infos[video] = info
                         if info and info.duration > 0:
                             video_info_map[video] = info
                         probed += 1
@@ -2,6 +2,7 @@
 Video encoding module for re-encoding videos to modern specifications
 """
 
+import functools
 import os
 import subprocess
 import json
@@ -12,12 +13,97 @@ import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from queue import Queue
-from typing import Optional, Dict
+from typing import Container, Optional, Dict, List
 from video_analyzer import VideoInfo
 from shutdown_manager import shutdown_requested
 from ui import console, section_header, create_encoding_progress, fit_filename
 
 
+def available_cpu_count() -> int:
+    """
+    CPUs this process may actually run on
+
+    os.cpu_count() reports every core on the host, which overstates the budget
+    inside containers and under taskset/cgroup pinning; the scheduler affinity
+    mask is the real limit where the platform exposes it (Linux).
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        try:
+            return len(os.sched_getaffinity(0)) or 1
+        except OSError:
+            pass
+    return os.cpu_count() or 1
+
+
+def list_directory_names(directory: Path) -> Optional[frozenset[str]]:
+    """
+    Casefolded names of the entries in directory, or None if it can't be read
+
+    One readdir answers "does this output exist?" for every video in the
+    directory, instead of a stat per candidate path. Names are casefolded so
+    that case-insensitive filesystems (macOS, SMB) can't produce a miss.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name.casefold() for entry in entries)
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_available() -> bool:
+    """Run ffmpeg -version once per process; main() may be re-entered in-process"""
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-version'],
+            capture_output=True,
+            timeout=5
+        )
+        return result.returncode == 0
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+
+
+def _hw_encoder_args(target_codec: str) -> List[str]:
+    """
+    Tag and pixel format args for a hardware encode of target_codec
+
+    Hardware encoders take semi-planar input: p010 for 10-bit HEVC, nv12 for
+    8-bit H.264. HEVC also gets the hvc1 tag for Apple devices.
+    """
+    target = target_codec.lower()
+    if target == 'hevc':
+        return ['-tag:v', 'hvc1', '-pix_fmt', 'p010le']
+    if target == 'h264':
+        return ['-pix_fmt', 'nv12']
+    return []
+
+
+@functools.lru_cache(maxsize=None)
+def _hw_encoder_usable(encoder_name: str, target_codec: str) -> bool:
+    """
+    Check that a hardware encoder actually works on this machine
+
+    Static ffmpeg builds list NVENC/QSV/AMF encoders whether or not the
+    hardware exists, so -encoders alone isn't enough: encode one frame of a
+    synthetic source with the same pixel format real encodes use (hardware
+    without 10-bit HEVC must fail here, not on every file) and see if ffmpeg
+    succeeds. Cached for the process.
+    """
+    cmd = [
+        'ffmpeg', '-hide_banner', '-loglevel', 'error',
+        '-f', 'lavfi', '-i', 'color=black:s=256x256:r=1',
+        '-frames:v', '1', '-c:v', encoder_name,
+        *_hw_encoder_args(target_codec),
+        '-f', 'null', '-'
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=15)
+        return result.returncode == 0
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+
+
 class VideoEncoder:
     """Handles video re-encoding operations"""
 
@@ -28,6 +114,17 @@ class VideoEncoder:
         'av1': 'libaom-av1'
     }
 
+    # Hardware encoders per --hwaccel vendor. For 'auto' they are tried in this
+    # order and the first one that can encode a test frame wins.
+    HW_ENCODERS = {
+        'nvenc': {'h264': 'h264_nvenc', 'hevc': 'hevc_nvenc', 'av1': 'av1_nvenc'},
+        'qsv': {'h264': 'h264_qsv', 'hevc': 'hevc_qsv', 'av1': 'av1_qsv'},
+        'videotoolbox': {'h264': 'h264_videotoolbox', 'hevc': 'hevc_videotoolbox'},
+        'amf': {'h264': 'h264_amf', 'hevc': 'hevc_amf', 'av1': 'av1_amf'},
+    }
+
+    HWACCEL_CHOICES = ('auto', 'none', *HW_ENCODERS)
+
     # Extension mappings for output files
     EXTENSION_MAP = {
         'h264': '.mp4',
@@ -93,13 +190,17 @@ class VideoEncoder:
 
     def __init__(self, verbose: bool = False, recovery_mode: bool = False,
                  downscale_1080p: bool = False, parallel: int = 1,
-                 profile: Optional[str] = None):
+                 profile: Optional[str] = None, hwaccel: str = 'none'):
         self.verbose = verbose
         self.recovery_mode = recovery_mode
         self.downscale_1080p = downscale_1080p
         self.parallel = parallel
         self.profile = profile
         self.profile_settings = self.PROFILES.get(profile) if profile else None
+        if hwaccel not in self.HWACCEL_CHOICES:
+            raise ValueError(f"Unknown hwaccel {hwaccel!r}; expected one of {', '.join(self.HWACCEL_CHOICES)}")
+        self.hwaccel = hwaccel
+        self._video_encoders: Dict[str, str] = {}
 
         # ffmpeg joins x265 params with ':', so a ':' inside a value silently
         # corrupts the rest of the chain (x265 only warns on stderr).
@@ -126,6 +227,67 @@ class VideoEncoder:
         """
         self.parallel = max(1, parallel)
 
+    def resolve_video_encoder(self, target_codec: str) -> Optional[str]:
+        """
+        Pick the ffmpeg video encoder for a target codec
+
+        Honours --hwaccel: a named vendor or 'auto' selects the first working
+        hardware encoder for the codec, falling back to the software encoder
+        from CODEC_MAP when none is usable. The choice is made once per codec.
+
+        Args:
+            target_codec: Target codec (h264, hevc, av1)
+
+        Returns:
+            ffmpeg encoder name, or None for an unknown codec
+        """
+        target = target_codec.lower()
+        software = self.CODEC_MAP.get(target)
+        if software is None or self.hwaccel == 'none':
+            return software
+
+        if target not in self._video_encoders:
+            if self.hwaccel == 'auto':
+                vendors = list(self.HW_ENCODERS.values())
+            else:
+                vendors = [self.HW_ENCODERS[self.hwaccel]]
+
+            chosen = software
+            for names in vendors:
+                name = names.get(target)
+                if name and _hw_encoder_usable(name, target):
+                    chosen = name
+                    break
+            else:
+                if self.hwaccel != 'auto':
+                    console.print(
+                        f"[warning]{self.hwaccel} encoder for {target.upper()} is not available; "
+                        f"using {software}[/warning]"
+                    )
+            self._video_encoders[target] = chosen
+
+        return self._video_encoders[target]
+
+    def _hw_quality_args(self, encoder_name: str, preset: str, crf: int) -> List[str]:
+        """
+        Translate the CRF/preset settings into a hardware encoder's rate control
+
+        Hardware encoders have no -crf; each has its own constant-quality mode
+        on a roughly comparable 0-51 scale (VideoToolbox uses 1-100, higher is
+        better). x265/x264 presets don't apply, so a balanced quality preset
+        is used where the encoder has one.
+        """
+        if encoder_name.endswith('_nvenc'):
+            return ['-rc', 'vbr', '-cq', str(crf), '-b:v', '0', '-preset', 'p5']
+        if encoder_name.endswith('_qsv'):
+            return ['-global_quality', str(crf), '-preset', preset]
+        if encoder_name.endswith('_videotoolbox'):
+            quality = max(1, min(100, round(100 - crf * 1.5)))
+            return ['-q:v', str(quality)]
+        if encoder_name.endswith('_amf'):
+            return ['-rc', 'cqp', '-qp_i', str(crf), '-qp_p', str(crf)]
+        return []
+
     def _parse_time_to_seconds(self, time_str: str) -> float:
         """
         Parse FFmpeg time string to seconds
@@ -462,10 +624,11 @@ class VideoEncoder:
             return False
 
         # Get ffmpeg codec name
-        ffmpeg_codec = self.CODEC_MAP.get(target_codec.lower())
+        ffmpeg_codec = self.resolve_video_encoder(target_codec)
         if not ffmpeg_codec:
             console.print(f"[error]Error: Unknown codec: {target_codec}[/error]")
             return False
+        hardware_encode = ffmpeg_codec != self.CODEC_MAP[target_codec.lower()]
 
         # Resolve settings: explicit argument > active profile > built-in default
         profile = self.profile_settings or {}
@@ -584,11 +747,15 @@ class VideoEncoder:
             # Continue with encoding parameters
             # (audio codec is set by _build_stream_args above, so that its
             # per-stream fallbacks aren't overridden by a later global -c:a)
-            cmd.extend([
-                '-c:v', ffmpeg_codec,
-                '-preset', preset,
-                '-crf', str(crf),
-            ])
+            if hardware_encode:
+                cmd.extend(['-c:v', ffmpeg_codec])
+                cmd.extend(self._hw_quality_args(ffmpeg_codec, preset, crf))
+            else:
+                cmd.extend([
+                    '-c:v', ffmpeg_codec,
+                    '-preset', preset,
+                    '-crf', str(crf),
+                ])
 
             # Note: FFmpeg's -threads flag is ignored by libx265 (x265 manages
             # its own threading via -x265-params). Thread control for x265 is
@@ -625,7 +792,12 @@ class VideoEncoder:
                 cmd.extend(['-vf', ",".join(vf_filters)])
 
             # Add codec-specific parameters
-            if target_codec.lower() == 'hevc':
+            if hardware_encode:
+                # Same container/tag choices as the software path; hardware
+                # encoders have no x265 params or thread budget to set.
+                cmd.extend(_hw_encoder_args(target_codec))
+                cmd.extend(['-movflags', 'faststart'])
+            elif target_codec.lower() == 'hevc':
                 # Add macOS QuickLook compatibility
                 # Use hvc1 tag instead of hev1 for Apple device compatibility
                 cmd.extend(['-tag:v', 'hvc1'])
@@ -676,7 +848,7 @@ class VideoEncoder:
                         console.print(f"  Large file ({file_size_gb:.1f}GB) - memory-safe x265 params (2 frame-threads, bframes=3, ref=2)", style="dim")
                 elif self.parallel > 1:
                     # Parallel mode: constrain threads per instance to share CPU
-                    cpu_count = os.cpu_count() or 4
+                    cpu_count = available_cpu_count()
                     pools = max(2, cpu_count // self.parallel)
                     frame_threads = max(1, pools // 2)
                     x265_params.extend([
@@ -696,7 +868,7 @@ class VideoEncoder:
                 # Add movflags for better QuickLook compatibility
                 cmd.extend(['-movflags', 'faststart'])
                 if self.parallel > 1:
-                    cpu_count = os.cpu_count() or 4
+                    cpu_count = available_cpu_count()
                     cmd.extend(['-threads', str(max(2, cpu_count // self.parallel))])
             elif target_codec.lower() == 'av1':
                 # Add AV1-specific parameters
@@ -704,7 +876,7 @@ class VideoEncoder:
                 # Add movflags for better QuickLook compatibility
                 cmd.extend(['-movflags', 'faststart'])
                 if self.parallel > 1:
-                    cpu_count = os.cpu_count() or 4
+                    cpu_count = available_cpu_count()
                     cmd.extend(['-threads', str(max(2, cpu_count // self.parallel))])
 
             # Add final flags
@@ -1095,6 +1267,19 @@ class VideoEncoder:
             filename = input_path.stem + suffix + extension
             return input_path.parent / filename
 
+    @staticmethod
+    def _pre_encode_state(video_path: Path, output_path: Path) -> tuple[int, bool]:
+        """
+        Return (input size, whether the output already exists) for session stats
+
+        A missing input reports a size of 0.
+        """
+        try:
+            input_size = video_path.stat().st_size
+        except OSError:
+            input_size = 0
+        return input_size, output_path.exists()
+
     @staticmethod
     def _format_size(size_bytes: int) -> str:
         """Format bytes to human-readable size."""
@@ -1248,8 +1433,7 @@ class VideoEncoder:
                     )
                     video_info = video_infos.get(video_path) if video_infos else None
 
-                    input_size = video_path.stat().st_size if video_path.exists() else 0
-                    output_existed_before = output_path.exists()
+                    input_size, output_existed_before = self._pre_encode_state(video_path, output_path)
                     file_start = time.monotonic()
 
                     try:
@@ -1380,22 +1564,36 @@ class VideoEncoder:
         replace_original = kwargs.get('replace_original', False)
         batch_start = time.monotonic()
 
+        output_paths = [
+            self.get_output_path(video_path, output_dir, target_codec=target_codec)
+            for video_path in video_paths
+        ]
+
+        # Stat the next file in the background while the current one encodes,
+        # so network round trips don't sit between consecutive ffmpeg runs
         try:
-            with create_encoding_progress() as batch_progress:
+            with create_encoding_progress() as batch_progress, ThreadPoolExecutor(max_workers=1) as prefetcher:
                 overall_task = batch_progress.add_task("Encoding batch", total=total, speed="", eta="")
                 file_task = batch_progress.add_task("", total=None, speed="", eta="")
 
+                pending_state = None
+                if video_paths:
+                    pending_state = prefetcher.submit(self._pre_encode_state, video_paths[0], output_paths[0])
+
                 for idx, video_path in enumerate(video_paths, start=1):
                     # Check for graceful shutdown request
                     if shutdown_requested():
                         break
 
-                    output_path = self.get_output_path(video_path, output_dir, target_codec=target_codec)
+                    output_path = output_paths[idx - 1]
                     video_info = video_infos.get(video_path) if video_infos else None
 
                     # Track stats for session summary
-                    input_size = video_path.stat().st_size if video_path.exists() else 0
-                    output_existed_before = output_path.exists()
+                    input_size, output_existed_before = pending_state.result()
+                    if idx < total:
+                        pending_state = prefetcher.submit(
+                            self._pre_encode_state, video_paths[idx], output_paths[idx]
+                        )
                     file_start = time.monotonic()
 
                     result = self.re_encode_video(
@@ -1457,15 +1655,7 @@ class VideoEncoder:
         Returns:
             True if ffmpeg is available, False otherwise
         """
-        try:
-            result = subprocess.run(
-                ['ffmpeg', '-version'],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        return _ffmpeg_available()
 
     def get_estimated_size(
         self,
@@ -1504,7 +1694,8 @@ class VideoEncoder:
         self,
         input_path: Path,
         target_codec: str = 'hevc',
-        check_suffixes: list[str] = None
+        check_suffixes: list[str] = None,
+        dir_names: Optional[Container[str]] = None
     ) -> Optional[Path]:
         """
         Check if a valid re-encoded output already exists for the input file
@@ -1515,6 +1706,9 @@ class VideoEncoder:
             input_path: Path to the source video file
             target_codec: Target codec (determines expected extension)
             check_suffixes: List of suffixes to check (default: ['_reencoded', '_quicklook'])
+            dir_names: Optional listing of input_path's directory from
+                      list_directory_names(); candidates missing from it are
+                      skipped without touching the filesystem
 
         Returns:
             Path to existing valid output, or None if no valid output exists
@@ -1530,6 +1724,9 @@ class VideoEncoder:
             # Build potential output path
             potential_output = input_path.parent / (input_path.stem + suffix + target_extension)
 
+            if dir_names is not None and potential_output.name.casefold() not in dir_names:
+                continue
+
             if potential_output.exists():
                 # Validate the existing output
                 if self._validate_output(potential_output, source_info=None, lenient=self.recovery_mode):
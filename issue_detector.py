@@ -7,6 +7,17 @@ from pathlib import Path
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
+from video_analyzer import VideoCache, VideoInfo
+
+
+def _parse_frame_rate(fps_str: str) -> Optional[float]:
+    """Parse an ffprobe rate like '30000/1001'; 0 for a zero denominator, None if malformed"""
+    try:
+        num, den = map(int, fps_str.split('/'))
+        return num / den if den != 0 else 0
+    except ValueError:
+        return None
+
 
 @dataclass
 class VideoIssue:
@@ -20,8 +31,18 @@ class VideoIssue:
 class IssueDetector:
     """Detects encoding issues and corrupted video files"""
 
-    def __init__(self, verbose: bool = False):
+    # Integrity results that reflect the run rather than the file; never cached
+    UNCACHED_ISSUE_TYPES = {'timeout', 'check_failed'}
+
+    def __init__(self, verbose: bool = False, cache: Optional[VideoCache] = None):
+        """
+        Args:
+            verbose: Enable verbose output
+            cache: Optional VideoCache; deep-scan results are stored in it so
+                   unchanged files aren't decoded again on later runs
+        """
         self.verbose = verbose
+        self.cache = cache
 
     def check_file_integrity(self, video_path: Path) -> List[VideoIssue]:
         """
@@ -92,17 +113,55 @@ class IssueDetector:
 
         return issues
 
-    def check_incomplete_video(self, video_path: Path, min_duration: float = 1.0) -> Optional[VideoIssue]:
+    def _cached_integrity(self, video_path: Path) -> List[VideoIssue]:
+        """
+        Deep integrity check, served from the cache when the file is unchanged
+        """
+        if self.cache is None:
+            return self.check_file_integrity(video_path)
+
+        cached = self.cache.get_integrity(video_path)
+        if cached is not None:
+            return [VideoIssue(file_path=video_path, **issue) for issue in cached]
+
+        issues = self.check_file_integrity(video_path)
+        if not any(issue.issue_type in self.UNCACHED_ISSUE_TYPES for issue in issues):
+            self.cache.set_integrity(video_path, [
+                {'issue_type': issue.issue_type, 'severity': issue.severity, 'description': issue.description}
+                for issue in issues
+            ])
+        return issues
+
+    def check_incomplete_video(self, video_path: Path, min_duration: float = 1.0,
+                               info: Optional[VideoInfo] = None) -> Optional[VideoIssue]:
         """
         Check if video appears incomplete (too short or no duration)
 
         Args:
             video_path: Path to video file
             min_duration: Minimum expected duration in seconds
+            info: Already-probed VideoInfo; skips the ffprobe call when valid
 
         Returns:
             VideoIssue if video appears incomplete, None otherwise
         """
+        if info is not None and info.is_valid:
+            if info.duration <= 0:
+                return VideoIssue(
+                    file_path=video_path,
+                    issue_type='incomplete',
+                    severity='critical',
+                    description='Video has no duration (possibly incomplete)'
+                )
+            if info.duration < min_duration:
+                return VideoIssue(
+                    file_path=video_path,
+                    issue_type='incomplete',
+                    severity='warning',
+                    description=f'Video duration is very short ({info.duration:.2f}s)'
+                )
+            return None
+
         try:
             cmd = [
                 'ffprobe',
@@ -167,13 +226,15 @@ class IssueDetector:
 
         return None
 
-    def check_missing_audio(self, video_path: Path, expect_audio: bool = True) -> Optional[VideoIssue]:
+    def check_missing_audio(self, video_path: Path, expect_audio: bool = True,
+                            info: Optional[VideoInfo] = None) -> Optional[VideoIssue]:
         """
         Check if video is missing audio when it should have it
 
         Args:
             video_path: Path to video file
             expect_audio: Whether audio is expected
+            info: Already-probed VideoInfo; skips the ffprobe call when valid
 
         Returns:
             VideoIssue if audio is missing, None otherwise
@@ -181,6 +242,16 @@ class IssueDetector:
         if not expect_audio:
             return None
 
+        if info is not None and info.is_valid:
+            if not info.has_audio:
+                return VideoIssue(
+                    file_path=video_path,
+                    issue_type='no_audio',
+                    severity='warning',
+                    description='Video has no audio stream'
+                )
+            return None
+
         try:
             cmd = [
                 'ffprobe',
@@ -207,16 +278,25 @@ class IssueDetector:
 
         return None
 
-    def check_unusual_specs(self, video_path: Path) -> List[VideoIssue]:
+    def check_unusual_specs(self, video_path: Path, info: Optional[VideoInfo] = None) -> List[VideoIssue]:
         """
         Check for unusual video specifications that might indicate issues
 
         Args:
             video_path: Path to video file
+            info: Already-probed VideoInfo; skips the ffprobe call when valid
 
         Returns:
             List of VideoIssue objects
         """
+        # VideoInfo.fps falls back to r_frame_rate and zeroes rates above 240,
+        # so judge the raw avg_frame_rate as the probe below does. Infos cached
+        # before it was recorded are probed again.
+        if info is not None and info.is_valid and info.avg_frame_rate is not None:
+            return self._spec_issues(
+                video_path, info.width, info.height, _parse_frame_rate(info.avg_frame_rate)
+            )
+
         issues = []
 
         try:
@@ -242,72 +322,90 @@ class IssueDetector:
                     key, value = line.split('=', 1)
                     props[key] = value
 
-            # Check for unusual dimensions
             width = int(props.get('width', 0))
             height = int(props.get('height', 0))
 
-            if width == 0 or height == 0:
+            fps = _parse_frame_rate(props.get('avg_frame_rate', '0/1'))
+            issues = self._spec_issues(video_path, width, height, fps)
+
+        except Exception as e:
+            if self.verbose:
+                print(f"Warning: Could not check specs for {video_path}: {e}")
+
+        return issues
+
+    def _spec_issues(self, video_path: Path, width: int, height: int, fps: Optional[float]) -> List[VideoIssue]:
+        """
+        Flag unusual dimensions, aspect ratio and frame rate
+
+        Args:
+            video_path: Path to video file
+            width: Frame width in pixels
+            height: Frame height in pixels
+            fps: Frames per second, or None if it couldn't be parsed
+
+        Returns:
+            List of VideoIssue objects
+        """
+        issues = []
+
+        # Check for unusual dimensions
+        if width == 0 or height == 0:
+            issues.append(VideoIssue(
+                file_path=video_path,
+                issue_type='invalid_dimensions',
+                severity='critical',
+                description=f'Invalid dimensions: {width}x{height}'
+            ))
+        elif width < 320 or height < 240:
+            issues.append(VideoIssue(
+                file_path=video_path,
+                issue_type='low_resolution',
+                severity='info',
+                description=f'Unusually low resolution: {width}x{height}'
+            ))
+
+        # Check for unusual aspect ratio
+        if width > 0 and height > 0:
+            aspect = width / height
+            if aspect < 0.5 or aspect > 3.0:
+                issues.append(VideoIssue(
+                    file_path=video_path,
+                    issue_type='unusual_aspect',
+                    severity='info',
+                    description=f'Unusual aspect ratio: {aspect:.2f}'
+                ))
+
+        # Check frame rate
+        if fps is not None:
+            if fps == 0:
                 issues.append(VideoIssue(
                     file_path=video_path,
-                    issue_type='invalid_dimensions',
+                    issue_type='invalid_fps',
                     severity='critical',
-                    description=f'Invalid dimensions: {width}x{height}'
+                    description='Invalid frame rate (0 FPS)'
                 ))
-            elif width < 320 or height < 240:
+            elif fps > 120:
                 issues.append(VideoIssue(
                     file_path=video_path,
-                    issue_type='low_resolution',
+                    issue_type='high_fps',
                     severity='info',
-                    description=f'Unusually low resolution: {width}x{height}'
+                    description=f'Unusually high frame rate: {fps:.2f} FPS'
                 ))
 
-            # Check for unusual aspect ratio
-            if width > 0 and height > 0:
-                aspect = width / height
-                if aspect < 0.5 or aspect > 3.0:
-                    issues.append(VideoIssue(
-                        file_path=video_path,
-                        issue_type='unusual_aspect',
-                        severity='info',
-                        description=f'Unusual aspect ratio: {aspect:.2f}'
-                    ))
-
-            # Check frame rate
-            fps_str = props.get('avg_frame_rate', '0/1')
-            try:
-                num, den = map(int, fps_str.split('/'))
-                fps = num / den if den != 0 else 0
-
-                if fps == 0:
-                    issues.append(VideoIssue(
-                        file_path=video_path,
-                        issue_type='invalid_fps',
-                        severity='critical',
-                        description='Invalid frame rate (0 FPS)'
-                    ))
-                elif fps > 120:
-                    issues.append(VideoIssue(
-                        file_path=video_path,
-                        issue_type='high_fps',
-                        severity='info',
-                        description=f'Unusually high frame rate: {fps:.2f} FPS'
-                    ))
-            except:
-                pass
-
-        except Exception as e:
-            if self.verbose:
-                print(f"Warning: Could not check specs for {video_path}: {e}")
-
         return issues
 
-    def scan_video(self, video_path: Path, deep_scan: bool = False) -> List[VideoIssue]:
+    def scan_video(self, video_path: Path, deep_scan: bool = False,
+                   info: Optional[VideoInfo] = None) -> List[VideoIssue]:
         """
         Perform comprehensive scan of video file
 
         Args:
             video_path: Path to video file
             deep_scan: Whether to perform deep integrity check (slower)
+            info: VideoInfo from an earlier analysis pass; when valid, the
+                  duration, audio and spec checks reuse it instead of running
+                  three more ffprobe processes
 
         Returns:
             List of all detected issues
@@ -318,22 +416,22 @@ class IssueDetector:
             print(f"Scanning: {video_path.name}")
 
         # Check for incomplete video
-        incomplete_issue = self.check_incomplete_video(video_path)
+        incomplete_issue = self.check_incomplete_video(video_path, info=info)
         if incomplete_issue:
             all_issues.append(incomplete_issue)
 
         # Check for missing audio
-        audio_issue = self.check_missing_audio(video_path)
+        audio_issue = self.check_missing_audio(video_path, info=info)
         if audio_issue:
             all_issues.append(audio_issue)
 
         # Check for unusual specs
-        spec_issues = self.check_unusual_specs(video_path)
+        spec_issues = self.check_unusual_specs(video_path, info=info)
         all_issues.extend(spec_issues)
 
         # Perform deep integrity check if requested
         if deep_scan:
-            integrity_issues = self.check_file_integrity(video_path)
+            integrity_issues = self._cached_integrity(video_path)
             all_issues.extend(integrity_issues)
 
         return all_issues
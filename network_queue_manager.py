@@ -12,6 +12,7 @@ This dramatically improves performance when working with network storage by:
 - Buffering files locally for consistent encoding speed
 """
 
+import os
 import shutil
 import subprocess
 import tempfile
@@ -19,6 +20,7 @@ import threading
 import queue
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict, Callable
 from dataclasses import dataclass, asdict
@@ -77,6 +79,10 @@ class NetworkQueueManager:
     - Main thread: Coordinates queues and tracks progress
     """
 
+    # Temp files unlinked concurrently by cleanup(); each unlink is a round
+    # trip when --temp-dir is on network or FUSE storage
+    CLEANUP_WORKERS = 32
+
     def __init__(
         self,
         temp_dir: Optional[Path] = None,
@@ -632,12 +638,37 @@ class NetworkQueueManager:
 
             return False
 
+    def _unlink_temp_files(self) -> None:
+        """Delete the regular files in the temp directory concurrently"""
+        with os.scandir(self.temp_dir) as entries:
+            paths = [entry.path for entry in entries if entry.is_file(follow_symlinks=False)]
+        if not paths:
+            return
+
+        def unlink(path: str) -> None:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+        workers = max(1, min(self.CLEANUP_WORKERS, len(paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # list() re-raises any unexpected error here, failing cleanup as rmtree would
+            list(executor.map(unlink, paths))
+
     def _get_temp_storage_usage(self) -> int:
         """Get current temp directory usage in bytes"""
+        # scandir knows each entry's type from the listing itself, so only
+        # regular files cost a stat. Workers delete temp files concurrently;
+        # one that vanishes mid-scan no longer takes up space.
         total = 0
-        for item in self.temp_dir.iterdir():
-            if item.is_file():
-                total += item.stat().st_size
+        with os.scandir(self.temp_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        total += entry.stat().st_size
+                except FileNotFoundError:
+                    pass
         return total
 
     def _all_downloaded_or_failed(self) -> bool:
@@ -974,6 +1005,8 @@ class NetworkQueueManager:
         """Clean up temp directory and state file"""
         try:
             if self.temp_dir.exists():
+                self._unlink_temp_files()
+                # Removes whatever is left (subdirectories) and the directory itself
                 shutil.rmtree(self.temp_dir)
             self.logger.info("Cleaned up temp directory")
         except Exception as e:
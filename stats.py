@@ -4,6 +4,7 @@ Statistics module for video library analysis.
 
 import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 
@@ -27,8 +28,9 @@ def format_size(size_bytes):
 class StatsCollector:
     """Collects and displays statistics about a video library."""
 
-    def __init__(self, analyzer: VideoAnalyzer):
+    def __init__(self, analyzer: VideoAnalyzer, workers: int = 1):
         self.analyzer = analyzer
+        self.workers = max(1, workers)
 
     def collect_stats(self, directory: Path, recursive: bool = True) -> Dict[str, int]:
         """
@@ -41,13 +43,19 @@ class StatsCollector:
         Returns:
             A dictionary mapping codec to total byte size.
         """
-        video_files = self.analyzer.find_videos(directory, recursive=recursive)
         codec_stats = defaultdict(int)
 
-        for video_file in video_files:
-            video_info = self.analyzer.get_video_info(video_file)
-            if video_info and video_info.is_valid:
-                codec_stats[video_info.codec] += video_info.file_size
+        # Submit each file as the walk finds it, so probing overlaps with
+        # listing the rest of the tree instead of waiting for the full list.
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(self.analyzer.get_video_info, video_file)
+                for video_file in self.analyzer.iter_videos(directory, recursive=recursive)
+            ]
+            for future in futures:
+                video_info = future.result()
+                if video_info and video_info.is_valid:
+                    codec_stats[video_info.codec] += video_info.file_size
 
         return codec_stats
 
@@ -16,6 +16,7 @@ def make_video_info(**overrides) -> VideoInfo:
         bitrate=5_000_000,
         duration=120.0,
         fps=24.0,
+        avg_frame_rate="24/1",
         has_audio=True,
         audio_codec="aac",
         audio_stream_count=1,
@@ -156,6 +156,104 @@ class TestFindDuplicatesByFilename:
         groups = detector.find_duplicates_by_filename([])
         assert len(groups) == 0
 
+    def test_known_infos_not_reprobed(self, detector):
+        paths = [Path("/v/movie.mp4"), Path("/v/movie.avi")]
+        known = MagicMock(duration=60.0, is_valid=True)
+        probed = MagicMock(duration=60.5, is_valid=True)
+        analyzer = MagicMock()
+        analyzer.get_video_info.return_value = probed
+        infos = {paths[0]: known}
+        groups = detector.find_duplicates_by_filename(paths, analyzer=analyzer, video_infos=infos)
+        assert len(groups) == 1
+        analyzer.get_video_info.assert_called_once_with(paths[1])
+        assert infos[paths[1]] is probed
+
+
+# ===== Packed hashes =====
+
+class TestPackedHashes:
+
+    @pytest.fixture
+    def detector(self):
+        return DuplicateDetector()
+
+    def _make_hash(self, value: int = 0, size: int = 12) -> imagehash.ImageHash:
+        arr = np.zeros((size, size), dtype=bool)
+        arr.reshape(-1)[:value] = True
+        return imagehash.ImageHash(arr)
+
+    def _pack(self, detector, frames):
+        detector.compute_video_hash = MagicMock(return_value=frames)
+        return detector._packed_video_hash(Path("v.mp4"))
+
+    def test_packed_shape(self, detector):
+        packed = self._pack(detector, [self._make_hash(0), self._make_hash(40), self._make_hash(7)])
+        assert packed.shape == (3, 18)
+        assert packed.dtype == np.uint8
+
+    def test_vectorized_distances_match_imagehash(self, detector):
+        videos = [
+            [self._make_hash(0), self._make_hash(40), self._make_hash(7)],
+            [self._make_hash(5), self._make_hash(40)],
+            [self._make_hash(100), self._make_hash(3), self._make_hash(9)],
+        ]
+        packed = [self._pack(detector, frames) for frames in videos]
+        matrix = np.zeros((3, 3, 18), dtype=np.uint8)
+        for k, p in enumerate(packed):
+            matrix[k, :len(p)] = p
+        counts = np.array([len(p) for p in packed])
+        distances = detector._hash_distances(matrix, counts, 0, np.array([1, 2]))
+        assert distances.tolist() == [
+            detector._compare_video_hashes(videos[0], videos[1]),
+            detector._compare_video_hashes(videos[0], videos[2]),
+        ]
+
+    def test_greedy_grouping_claims_from_first_seed(self, detector):
+        # 0~1 and 1~2 are within threshold but 0~2 is not: 2 stays ungrouped
+        videos = [[self._make_hash(0)], [self._make_hash(10)], [self._make_hash(20)]]
+        packed = [self._pack(detector, frames) for frames in videos]
+        assert detector._group_similar_hashes(packed, None, 2.0) == [[0, 1]]
+
+    def test_grouping_respects_durations(self, detector):
+        packed = [self._pack(detector, [self._make_hash(0)]) for _ in range(3)]
+        assert detector._group_similar_hashes(packed, [100.0, 400.0, 0], 2.0) == [[0, 2]]
+
+    def test_failed_hash_packs_to_none(self, detector):
+        detector.compute_video_hash = MagicMock(return_value=None)
+        assert detector._packed_video_hash(Path("a.mp4")) is None
+
+    def test_duration_index_matches_pairwise_reference(self, detector):
+        rng = np.random.default_rng(7)
+        videos = [
+            [self._make_hash(int(rng.integers(0, 30))) for _ in range(int(rng.integers(1, 4)))]
+            for _ in range(40)
+        ]
+        durations = [float(rng.choice([0, 60, 61, 62.5, 64, 300])) for _ in videos]
+        packed = [self._pack(detector, frames) for frames in videos]
+
+        def durations_match(i, j):
+            # Unknown (zero) durations match anything
+            if durations[i] <= 0 or durations[j] <= 0:
+                return True
+            return abs(durations[i] - durations[j]) <= 2.0
+
+        expected, grouped = [], set()
+        for i in range(len(videos)):
+            if i in grouped:
+                continue
+            grouped.add(i)
+            group = [i]
+            for j in range(i + 1, len(videos)):
+                if j in grouped or not durations_match(i, j):
+                    continue
+                if detector._compare_video_hashes(videos[i], videos[j]) <= detector.threshold:
+                    group.append(j)
+                    grouped.add(j)
+            if len(group) > 1:
+                expected.append(group)
+
+        assert detector._group_similar_hashes(packed, durations, 2.0) == expected
+
 
 # ===== DuplicateDetector initialization =====
 
@@ -172,3 +270,96 @@ class TestDuplicateDetectorInit:
         assert d.hash_size == 8
         assert d.threshold == 10
         assert d.num_samples == 5
+
+    def test_workers_default_in_process(self):
+        assert DuplicateDetector().workers == 1
+
+    def test_workers_clamped_to_one(self):
+        assert DuplicateDetector(workers=0).workers == 1
+
+
+# ===== Hardware decoding =====
+
+class TestHardwareDecode:
+
+    def test_disabled_by_default(self):
+        assert DuplicateDetector().hw_decode is False
+
+    def test_falls_back_to_software_when_hardware_yields_no_frames(self, tmp_path):
+        detector = DuplicateDetector(hw_decode=True)
+        modes = []
+
+        def fake_open(video_path, hw_decode):
+            modes.append(hw_decode)
+            cap = MagicMock()
+            cap.isOpened.return_value = True
+            cap.get.return_value = 10
+            frame = np.zeros((4, 4, 3), dtype=np.uint8)
+            cap.read.return_value = (False, None) if hw_decode else (True, frame)
+            return cap
+
+        detector._open_capture = fake_open
+        frames = detector.extract_multiple_frames(tmp_path / "clip.mp4", num_frames=2)
+        assert len(frames) == 2
+        assert modes == [True, False]
+
+    def test_unreadable_file_not_retried(self, tmp_path):
+        path = tmp_path / "clip.mp4"
+        path.write_bytes(b"not a video")
+        detector = DuplicateDetector(hw_decode=True)
+        modes = []
+        real_open = detector._open_capture
+
+        def record(video_path, hw_decode):
+            modes.append(hw_decode)
+            return real_open(video_path, hw_decode)
+
+        detector._open_capture = record
+        assert detector.extract_multiple_frames(path, num_frames=2) == []
+        assert modes == [True]
+
+
+# ===== find_duplicates with a process pool =====
+
+class TestFindDuplicatesWorkers:
+
+    def test_pool_reports_unreadable_files_in_order(self, tmp_path):
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"broken{i}.mp4"
+            path.write_bytes(b"not a video")
+            paths.append(path)
+        detector = DuplicateDetector(workers=2)
+        groups, failed = detector.find_duplicates(paths)
+        assert groups == {}
+        assert failed == paths
+
+
+# ===== Duration prefilter =====
+
+class TestDurationPrefilter:
+
+    @pytest.fixture
+    def detector(self):
+        return DuplicateDetector()
+
+    def test_unique_durations_skip_hashing(self, detector):
+        paths = [Path("a.mp4"), Path("b.mp4"), Path("c.mp4")]
+        durations = {paths[0]: 60.0, paths[1]: 300.0, paths[2]: 1200.0}
+        detector.compute_video_hash = MagicMock(side_effect=AssertionError("hashed"))
+        groups, failed = detector.find_duplicates(paths, durations=durations)
+        assert groups == {}
+        assert failed == []
+
+    def test_only_length_compatible_videos_hashed(self, detector):
+        paths = [Path("a.mp4"), Path("a_reencoded.mp4"), Path("other.mp4")]
+        durations = {paths[0]: 600.0, paths[1]: 601.5, paths[2]: 45.0}
+        detector.compute_video_hash = MagicMock(return_value=None)
+        detector.find_duplicates(paths, durations=durations)
+        hashed = [call.args[0] for call in detector.compute_video_hash.call_args_list]
+        assert hashed == [paths[0], paths[1]]
+
+    def test_unknown_duration_always_hashed(self, detector):
+        paths = [Path("a.mp4"), Path("broken.mp4")]
+        durations = {paths[0]: 600.0}
+        assert detector._duration_candidates(paths, durations, 2.0) == [paths[1]]
@@ -6,7 +6,7 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-from encoder import VideoEncoder
+from encoder import VideoEncoder, _ffmpeg_available, _hw_encoder_usable, list_directory_names
 from helpers import make_video_info
 
 
@@ -268,3 +268,145 @@ class TestCodecMaps:
         encoder = VideoEncoder()
         for codec, ext in encoder.EXTENSION_MAP.items():
             assert ext == ".mp4", f"Codec {codec} has unexpected extension {ext}"
+
+
+# ===== check_ffmpeg_available =====
+
+class TestCheckFfmpegAvailable:
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        _ffmpeg_available.cache_clear()
+        yield
+        _ffmpeg_available.cache_clear()
+
+    def test_probes_ffmpeg_once(self):
+        with patch('encoder.subprocess.run', return_value=MagicMock(returncode=0)) as run:
+            assert VideoEncoder().check_ffmpeg_available()
+            assert VideoEncoder().check_ffmpeg_available()
+        assert run.call_count == 1
+
+    def test_missing_binary_reports_unavailable(self):
+        with patch('encoder.subprocess.run', side_effect=FileNotFoundError):
+            assert not VideoEncoder().check_ffmpeg_available()
+
+
+# ===== find_existing_output with a directory listing =====
+
+class TestFindExistingOutputListing:
+
+    def test_listing_without_candidate_skips_filesystem(self, tmp_path):
+        src = tmp_path / "clip.mkv"
+        names = list_directory_names(tmp_path)
+        with patch.object(Path, 'exists', side_effect=AssertionError("stat'ed")):
+            assert VideoEncoder().find_existing_output(src, dir_names=names) is None
+
+    def test_listed_candidate_is_validated(self, tmp_path):
+        src = tmp_path / "clip.mkv"
+        (tmp_path / "clip_reencoded.mp4").write_bytes(b"x")
+        names = list_directory_names(tmp_path)
+        with patch.object(VideoEncoder, '_validate_output', return_value=True):
+            found = VideoEncoder().find_existing_output(src, dir_names=names)
+        assert found == tmp_path / "clip_reencoded.mp4"
+
+    def test_listing_is_case_insensitive(self, tmp_path):
+        (tmp_path / "Clip_Reencoded.MP4").write_bytes(b"x")
+        assert "clip_reencoded.mp4" in list_directory_names(tmp_path)
+
+    def test_unreadable_directory_returns_none(self, tmp_path):
+        assert list_directory_names(tmp_path / "missing") is None
+
+
+# ===== Sequential batch stats =====
+
+class TestSequentialBatchStats:
+
+    def test_prefetched_sizes_match_each_file(self, tmp_path):
+        """Stats for file N+1 are gathered during encode N but must stay per-file."""
+        videos = []
+        for i, size in enumerate((100, 200, 300)):
+            video = tmp_path / f"v{i}.mkv"
+            video.write_bytes(b"x" * size)
+            videos.append(video)
+        (tmp_path / "v1_reencoded.mp4").write_bytes(b"y")
+
+        encoder = VideoEncoder()
+        with patch.object(VideoEncoder, 're_encode_video', return_value=True), \
+             patch.object(VideoEncoder, '_print_session_summary') as summary:
+            results = encoder.batch_re_encode(videos)
+
+        assert results == dict.fromkeys(videos, True)
+        stats = summary.call_args[0][0]
+        assert [s['input_size'] for s in stats] == [100, 200, 300]
+        assert [s['skipped'] for s in stats] == [False, True, False]
+
+
+# ===== Hardware encoder selection =====
+
+class TestHardwareEncoder:
+
+    def _command(self, encoder, tmp_path, target_codec='hevc'):
+        """Build a re-encode command and return it without running ffmpeg."""
+        src = tmp_path / "in.mkv"
+        src.write_bytes(b"x" * 2048)
+        captured = {}
+
+        def fake_popen(cmd, **kwargs):
+            captured['cmd'] = cmd
+            raise RuntimeError("stop after command build")
+
+        with patch.object(VideoEncoder, 'find_existing_output', return_value=None), \
+             patch.object(VideoEncoder, '_probe_streams', return_value=[
+                 {'index': 0, 'codec_type': 'video', 'codec_name': 'h264', 'disposition': {}},
+             ]), \
+             patch('encoder.subprocess.Popen', side_effect=fake_popen):
+            encoder.re_encode_video(src, tmp_path / "out.mp4", target_codec=target_codec, crf=22)
+        return captured['cmd']
+
+    def test_none_uses_software(self):
+        encoder = VideoEncoder()
+        assert encoder.resolve_video_encoder('hevc') == 'libx265'
+
+    def test_unknown_hwaccel_rejected(self):
+        with pytest.raises(ValueError):
+            VideoEncoder(hwaccel='cuda')
+
+    def test_auto_picks_first_usable(self):
+        encoder = VideoEncoder(hwaccel='auto')
+        with patch('encoder._hw_encoder_usable', side_effect=lambda name, target: name == 'hevc_qsv'):
+            assert encoder.resolve_video_encoder('hevc') == 'hevc_qsv'
+
+    def test_unavailable_vendor_falls_back_to_software(self):
+        encoder = VideoEncoder(hwaccel='nvenc')
+        with patch('encoder._hw_encoder_usable', return_value=False):
+            assert encoder.resolve_video_encoder('hevc') == 'libx265'
+
+    def test_choice_is_cached_per_codec(self):
+        encoder = VideoEncoder(hwaccel='auto')
+        with patch('encoder._hw_encoder_usable', return_value=True) as usable:
+            encoder.resolve_video_encoder('hevc')
+            encoder.resolve_video_encoder('hevc')
+        assert usable.call_count == 1
+
+    @pytest.mark.parametrize("encoder_name,target,pix_fmt", [
+        ('hevc_nvenc', 'hevc', 'p010le'),
+        ('h264_qsv', 'h264', 'nv12'),
+    ])
+    def test_probe_uses_encode_pixel_format(self, encoder_name, target, pix_fmt):
+        _hw_encoder_usable.cache_clear()
+        with patch('encoder.subprocess.run', return_value=MagicMock(returncode=0)) as run:
+            assert _hw_encoder_usable(encoder_name, target)
+        _hw_encoder_usable.cache_clear()
+        cmd = run.call_args.args[0]
+        assert cmd[cmd.index('-pix_fmt') + 1] == pix_fmt
+
+    def test_nvenc_command_uses_constant_quality(self, tmp_path):
+        encoder = VideoEncoder(hwaccel='nvenc')
+        with patch('encoder._hw_encoder_usable', return_value=True):
+            cmd = self._command(encoder, tmp_path)
+        assert cmd[cmd.index('-c:v') + 1] == 'hevc_nvenc'
+        assert cmd[cmd.index('-cq') + 1] == '22'
+        assert cmd[cmd.index('-pix_fmt') + 1] == 'p010le'
+        assert cmd[cmd.index('-tag:v') + 1] == 'hvc1'
+        assert '-crf' not in cmd
+        assert '-x265-params' not in cmd
@@ -1,10 +1,13 @@
 """Tests for issue_detector.py — scan_video and individual check methods."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from issue_detector import IssueDetector, VideoIssue
+from video_analyzer import VideoCache
+from helpers import make_video_info
 
 
 class TestIssueDetectorIntegration:
@@ -73,6 +76,79 @@ class TestIssueDetectorUnit:
         assert len(issues) > 0
 
 
+class TestScanWithVideoInfo:
+    """scan_video(info=...) reuses metadata from the spec check."""
+
+    @pytest.fixture
+    def detector(self):
+        return IssueDetector()
+
+    def test_healthy_info_runs_no_subprocess(self, detector):
+        with patch("issue_detector.subprocess.run", side_effect=AssertionError("probed")):
+            issues = detector.scan_video(Path("/fake/video.mp4"), info=make_video_info())
+        assert issues == []
+
+    def test_info_flags_missing_audio_and_short_duration(self, detector):
+        info = make_video_info(has_audio=False, duration=0.5)
+        types = {i.issue_type for i in detector.scan_video(Path("/fake/video.mp4"), info=info)}
+        assert types == {"no_audio", "incomplete"}
+
+    def test_info_flags_invalid_dimensions_and_fps(self, detector):
+        info = make_video_info(width=0, height=0, fps=0.0, avg_frame_rate="0/1")
+        issues = detector.check_unusual_specs(Path("/fake/video.mp4"), info=info)
+        assert {i.issue_type for i in issues} == {"invalid_dimensions", "invalid_fps"}
+
+    def test_info_high_fps_judged_from_raw_rate(self, detector):
+        # VideoInfo.fps zeroes rates above 240; the raw rate is only high
+        info = make_video_info(fps=0.0, avg_frame_rate="300/1")
+        issues = detector.check_unusual_specs(Path("/fake/video.mp4"), info=info)
+        assert [(i.issue_type, i.severity) for i in issues] == [("high_fps", "info")]
+
+    def test_info_zero_avg_rate_flagged_despite_fallback(self, detector):
+        # VideoInfo.fps fell back to r_frame_rate; the probe path would not
+        info = make_video_info(fps=25.0, avg_frame_rate="0/0")
+        issues = detector.check_unusual_specs(Path("/fake/video.mp4"), info=info)
+        assert [(i.issue_type, i.severity) for i in issues] == [("invalid_fps", "critical")]
+
+    def test_info_without_raw_rate_probes(self, detector):
+        info = make_video_info(avg_frame_rate=None)
+        with patch("issue_detector.subprocess.run", side_effect=OSError) as run:
+            detector.check_unusual_specs(Path("/fake/video.mp4"), info=info)
+        run.assert_called_once()
+
+    def test_invalid_info_falls_back_to_probing(self, detector):
+        info = make_video_info(is_valid=False)
+        issue = detector.check_incomplete_video(Path("/nonexistent/video.mp4"), info=info)
+        assert issue is not None
+
+
+class TestDeepScanCache:
+    """Deep-scan results are cached per file version."""
+
+    @pytest.fixture
+    def video_file(self, tmp_path):
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"\x00" * 5000)
+        return video_file
+
+    def test_second_scan_served_from_cache(self, tmp_path, video_file):
+        detector = IssueDetector(cache=VideoCache(tmp_path / "cache.json"))
+        corrupt = [VideoIssue(video_file, "corruption", "critical", "bad frame")]
+        with patch.object(detector, "check_file_integrity", return_value=corrupt) as check:
+            first = detector._cached_integrity(video_file)
+            second = detector._cached_integrity(video_file)
+        assert check.call_count == 1
+        assert first == second == corrupt
+
+    def test_timeouts_not_cached(self, tmp_path, video_file):
+        detector = IssueDetector(cache=VideoCache(tmp_path / "cache.json"))
+        timeout = [VideoIssue(video_file, "timeout", "warning", "timed out")]
+        with patch.object(detector, "check_file_integrity", return_value=timeout) as check:
+            detector._cached_integrity(video_file)
+            detector._cached_integrity(video_file)
+        assert check.call_count == 2
+
+
 class TestVideoIssue:
 
     def test_dataclass_fields(self):
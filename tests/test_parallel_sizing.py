@@ -19,7 +19,7 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from encoder import VideoEncoder
+from encoder import VideoEncoder, available_cpu_count
 from network_queue_manager import NetworkQueueManager, QueuedFile, FileState
 
 
@@ -181,7 +181,7 @@ class TestX265ThreadBudget:
     def test_starved_pools_without_clamp(self, tmp_path):
         """Regression guard: -j 4 on a 14-core box gives each encode 3 pools."""
         encoder = VideoEncoder(parallel=4)
-        with patch('encoder.os.cpu_count', return_value=14):
+        with patch('encoder.available_cpu_count', return_value=14):
             params = self._x265_params(encoder, tmp_path)
         assert 'pools=3' in params
         assert 'frame-threads=1' in params
@@ -190,7 +190,7 @@ class TestX265ThreadBudget:
         """After clamping to the 2 files that exist, each encode gets half the box."""
         encoder = VideoEncoder(parallel=4)
         encoder.set_parallel(2)
-        with patch('encoder.os.cpu_count', return_value=14):
+        with patch('encoder.available_cpu_count', return_value=14):
             params = self._x265_params(encoder, tmp_path)
         assert 'pools=7' in params
         assert 'frame-threads=3' in params
@@ -198,7 +198,20 @@ class TestX265ThreadBudget:
     def test_sequential_adds_no_thread_limits(self, tmp_path):
         """parallel=1 must not constrain x265 at all."""
         encoder = VideoEncoder(parallel=1)
-        with patch('encoder.os.cpu_count', return_value=14):
+        with patch('encoder.available_cpu_count', return_value=14):
             params = self._x265_params(encoder, tmp_path)
         assert 'pools=' not in params
         assert 'frame-threads=' not in params
+
+
+class TestAvailableCpuCount:
+
+    def test_uses_affinity_mask(self):
+        with patch('encoder.os.sched_getaffinity', create=True, return_value={0, 1, 2}), \
+             patch('encoder.os.cpu_count', return_value=64):
+            assert available_cpu_count() == 3
+
+    def test_falls_back_to_cpu_count(self):
+        with patch('encoder.os.sched_getaffinity', create=True, side_effect=OSError), \
+             patch('encoder.os.cpu_count', return_value=8):
+            assert available_cpu_count() == 8
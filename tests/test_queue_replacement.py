@@ -10,9 +10,11 @@ Covers:
 - _validate_uploaded_video() method
 - load_state() handling of UPLOADED state
 - UI replacement table creation
+- cleanup() of the temp directory
 """
 
 import json
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -587,3 +589,29 @@ class TestReplacementDifferentExtension:
         assert summary['replaced'] == 0
         assert summary['failed'] == 1
         assert orig_mkv.exists(), "Original .mkv must be preserved on validation failure"
+
+
+# ---------------------------------------------------------------------------
+# Temp directory cleanup
+# ---------------------------------------------------------------------------
+
+class TestCleanup:
+    """cleanup() unlinks temp files concurrently, then removes the directory."""
+
+    def test_removes_files_subdirectories_and_directory(self, tmp_path):
+        temp_dir = tmp_path / "temp"
+        mgr = NetworkQueueManager(temp_dir=temp_dir, verbose=False)
+        for i in range(40):
+            (temp_dir / f"download_video{i}.mkv").write_bytes(b"\x00" * 10)
+        (temp_dir / "nested").mkdir()
+        (temp_dir / "nested" / "partial.mp4").write_bytes(b"\x00")
+        mgr.save_state()
+
+        mgr.cleanup()
+        assert not temp_dir.exists()
+
+    def test_missing_temp_dir_is_a_no_op(self, tmp_path):
+        mgr = NetworkQueueManager(temp_dir=tmp_path / "temp", verbose=False)
+        shutil.rmtree(mgr.temp_dir)
+        mgr.cleanup()
+        assert not mgr.temp_dir.exists()
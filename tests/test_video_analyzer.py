@@ -1,6 +1,7 @@
 """Tests for video_analyzer.py — VideoInfo, VideoCache, and VideoAnalyzer."""
 
 import json
+import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -42,6 +43,14 @@ class TestVideoInfo:
         VideoInfo.from_dict(d)
         assert d["file_path"] == original_path  # still a string, not Path
 
+    def test_codec_lower_is_not_serialized(self):
+        """codec_lower is derived, so cached entries must not store it."""
+        info = make_video_info(codec="HEVC")
+        assert info.codec_lower == "hevc"
+        d = info.to_dict()
+        assert "codec_lower" not in d
+        assert VideoInfo.from_dict(d).codec_lower == "hevc"
+
     def test_invalid_video_info(self):
         info = make_video_info(is_valid=False, error_message="ffprobe failed")
         assert not info.is_valid
@@ -85,6 +94,17 @@ class TestVideoCache:
         assert cache.get(video_file) is None
         assert cache.misses == 1
 
+    def test_get_uses_supplied_stat(self, cache_file, tmp_path):
+        """A caller that already stat'ed the file doesn't pay for a second stat."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"\x00" * 5000)
+        stat = video_file.stat()
+
+        cache = VideoCache(cache_file)
+        cache.set(video_file, make_video_info(file_path=video_file), stat)
+        with patch.object(Path, "stat", side_effect=AssertionError("stat called")):
+            assert cache.get(video_file, stat) is not None
+
     def test_save_and_reload(self, cache_file, tmp_path):
         """Cache persists to disk and can be reloaded."""
         video_file = tmp_path / "video.mp4"
@@ -101,6 +121,37 @@ class TestVideoCache:
         assert result is not None
         assert result.width == 1920
 
+    def test_refresh_ignores_entries_from_earlier_runs(self, cache_file, tmp_path):
+        """--refresh-metadata re-probes stored files but serves what it just stored."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"\x00" * 5000)
+
+        cache = VideoCache(cache_file)
+        cache.set(video_file, make_video_info(file_path=video_file))
+        cache.save()
+
+        refreshed = VideoCache(cache_file, refresh=True)
+        assert refreshed.get(video_file) is None
+        refreshed.set(video_file, make_video_info(file_path=video_file, codec="av1"))
+        assert refreshed.get(video_file).codec == "av1"
+
+    def test_integrity_results_survive_metadata_update(self, cache_file, tmp_path):
+        """Deep-scan results stay attached while the file is unchanged."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"\x00" * 5000)
+        issues = [{"issue_type": "corruption", "severity": "critical", "description": "bad frame"}]
+
+        cache = VideoCache(cache_file)
+        assert cache.get_integrity(video_file) is None
+        cache.set_integrity(video_file, issues)
+        # An integrity-only entry is not a metadata hit
+        assert cache.get(video_file) is None
+        cache.set(video_file, make_video_info(file_path=video_file))
+        assert cache.get_integrity(video_file) == issues
+
+        video_file.write_bytes(b"\x00" * 6000)
+        assert cache.get_integrity(video_file) is None
+
     def test_auto_save_at_100_updates(self, cache_file, tmp_path):
         """Cache auto-saves every 100 entries."""
         cache = VideoCache(cache_file)
@@ -237,6 +288,19 @@ class TestFindVideos:
         assert "clip.avi" not in names
         assert "trailer.wmv" not in names
 
+    def test_max_files_matches_sorted_prefix(self, analyzer, tmp_path):
+        for rel in ["b.mp4", "a/z.mkv", "a.b/c.mp4", "a-1.mp4", "c/d/e.avi", "c/a.mp4", "@eaDir/x.mp4"]:
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_bytes(b"\x00")
+        full = analyzer.find_videos(tmp_path, recursive=True)
+        for limit in range(len(full) + 2):
+            assert analyzer.find_videos(tmp_path, recursive=True, max_files=limit) == full[:limit]
+        assert analyzer.find_videos(tmp_path, max_files=1) == analyzer.find_videos(tmp_path)[:1]
+
+    def test_file_types_normalized(self, analyzer, video_dir):
+        videos = analyzer.find_videos(video_dir, file_types=[".MP4", " mkv", "mp4", ""])
+        assert {v.name for v in videos} == {"movie.mp4", "show.mkv"}
+
     def test_file_types_invalid_returns_empty(self, analyzer, video_dir):
         videos = analyzer.find_videos(video_dir, file_types=["xyz", "abc"])
         assert videos == []
@@ -253,9 +317,47 @@ class TestFindVideos:
         assert len(videos) == 1
         assert videos[0].name == "good.mp4"
 
+    def test_iter_videos_matches_find_videos(self, analyzer, nested_video_dir):
+        found = analyzer.find_videos(nested_video_dir, recursive=True)
+        streamed = list(analyzer.iter_videos(nested_video_dir, recursive=True))
+        assert sorted(streamed) == found
+
+    @pytest.mark.parametrize("recursive", [False, True])
+    def test_skips_dangling_symlinks_and_non_files(self, analyzer, tmp_path, recursive):
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "good.mp4").write_bytes(b"\x00" * 100)
+        (sub / "dangling.mp4").symlink_to(tmp_path / "gone.mp4")
+        (sub / "linked.mp4").symlink_to(sub / "good.mp4")
+        os.mkfifo(sub / "pipe.mp4")
+        root = tmp_path if recursive else sub
+        names = {v.name for v in analyzer.find_videos(root, recursive=recursive)}
+        assert names == {"good.mp4", "linked.mp4"}
+        limited = {v.name for v in analyzer.find_videos(root, recursive=recursive, max_files=10)}
+        assert limited == names
+
     def test_empty_directory(self, analyzer, tmp_path):
         assert analyzer.find_videos(tmp_path) == []
 
+    def test_extension_match_is_case_insensitive(self, analyzer, tmp_path):
+        (tmp_path / "LOUD.MP4").write_bytes(b"\x00" * 100)
+        (tmp_path / "Mixed.MkV").write_bytes(b"\x00" * 100)
+        names = {v.name for v in analyzer.find_videos(tmp_path)}
+        assert names == {"LOUD.MP4", "Mixed.MkV"}
+
+    def test_recursive_skips_housekeeping_dirs(self, analyzer, tmp_path):
+        (tmp_path / "@eaDir").mkdir()
+        (tmp_path / "@eaDir" / "SYNOVIDEO_preview.mp4").write_bytes(b"\x00" * 100)
+        (tmp_path / "keep.mp4").write_bytes(b"\x00" * 100)
+        videos = analyzer.find_videos(tmp_path, recursive=True)
+        assert [v.name for v in videos] == ["keep.mp4"]
+
+    def test_directory_named_like_video_skipped(self, analyzer, tmp_path):
+        (tmp_path / "folder.mp4").mkdir()
+        (tmp_path / "real.mp4").write_bytes(b"\x00" * 100)
+        videos = analyzer.find_videos(tmp_path)
+        assert [v.name for v in videos] == ["real.mp4"]
+
 
 # ===== VideoAnalyzer.get_video_info with real ffmpeg =====
 
@@ -279,6 +381,52 @@ class TestGetVideoInfoIntegration:
         assert analyzer.get_video_info(Path("/nonexistent/file.mp4")) is None
 
 
+# ===== Shared ffprobe output =====
+
+class TestSharedProbe:
+    """get_video_info and the QuickLook check reuse one ffprobe run per file."""
+
+    def test_info_and_quicklook_probe_once(self, tmp_path):
+        video = tmp_path / "shared.mp4"
+        video.write_bytes(b"\x00" * 100)
+        analyzer = VideoAnalyzer(use_cache=False)
+        mock_result = _mock_ffprobe_result("hevc", "hvc1", "yuv420p", "mov,mp4,m4a,3gp,3g2,mj2")
+        with patch("video_analyzer.subprocess.run", return_value=mock_result) as run:
+            analyzer.get_video_info(video)
+            analyzer.check_quicklook_compatibility(video)
+        assert run.call_count == 1
+
+    def test_modified_file_is_probed_again(self, tmp_path):
+        video = tmp_path / "changed.mp4"
+        video.write_bytes(b"\x00" * 100)
+        analyzer = VideoAnalyzer(use_cache=False)
+        mock_result = _mock_ffprobe_result("h264", "avc1", "yuv420p", "mp4")
+        with patch("video_analyzer.subprocess.run", return_value=mock_result) as run:
+            analyzer.check_quicklook_compatibility(video)
+            video.write_bytes(b"\x00" * 200)
+            analyzer.check_quicklook_compatibility(video)
+        assert run.call_count == 2
+
+    def test_uncached_probe_stats_file_once(self, tmp_path, cache_file):
+        video = tmp_path / "stat_once.mp4"
+        video.write_bytes(b"\x00" * 100)
+        analyzer = VideoAnalyzer(use_cache=False)
+        analyzer.cache = VideoCache(cache_file)
+        mock_result = _mock_ffprobe_result("hevc", "hvc1", "yuv420p", "mp4")
+        real_stat = Path.stat
+        calls = []
+
+        def counting_stat(self, *args, **kwargs):
+            if self == video:
+                calls.append(self)
+            return real_stat(self, *args, **kwargs)
+
+        with patch("video_analyzer.subprocess.run", return_value=mock_result), \
+                patch.object(Path, "stat", counting_stat):
+            assert analyzer.get_video_info(video) is not None
+        assert len(calls) == 1
+
+
 # ===== QuickLook compatibility =====
 
 def _mock_ffprobe_result(codec_name, codec_tag, pix_fmt, format_name):
@@ -392,3 +540,36 @@ class TestCheckQuickLookCompatibility:
         assert compat["compatible"] is False
         assert not compat["needs_remux"]
         assert not compat["needs_reencode"]
+
+
+class TestQuickLookFromVideoInfo:
+    """check_quicklook_compatibility(video_info=...) skips ffprobe when it can."""
+
+    def test_info_with_stream_fields_runs_no_subprocess(self):
+        analyzer = VideoAnalyzer(use_cache=False)
+        info = make_video_info(format_name="matroska,webm", codec_name="hevc",
+                               codec_tag="hev1", pix_fmt="yuv420p")
+        with patch("video_analyzer.subprocess.run", side_effect=AssertionError("probed")):
+            compat = analyzer.check_quicklook_compatibility(info.file_path, video_info=info)
+        assert compat["needs_remux"] is True
+        assert len(compat["issues"]) == 2
+
+    def test_info_matches_probed_verdict(self, tmp_path):
+        video = tmp_path / "probe.mp4"
+        video.write_bytes(b"\x00" * 100)
+        analyzer = VideoAnalyzer(use_cache=False)
+        mock_result = _mock_ffprobe_result("vp9", "", "yuv444p", "mp4")
+        with patch("video_analyzer.subprocess.run", return_value=mock_result):
+            info = analyzer.get_video_info(video)
+            probed = analyzer.check_quicklook_compatibility(Path("/fake/video.mp4"))
+        assert analyzer.check_quicklook_compatibility(video, video_info=info) == probed
+
+    def test_legacy_cached_info_falls_back_to_probe(self):
+        analyzer = VideoAnalyzer(use_cache=False)
+        mock_result = _mock_ffprobe_result("h264", "avc1", "yuv420p", "mp4")
+        with patch("video_analyzer.subprocess.run", return_value=mock_result) as run:
+            compat = analyzer.check_quicklook_compatibility(
+                Path("/fake/video.mp4"), video_info=make_video_info()
+            )
+        assert run.call_count == 1
+        assert compat["compatible"] is True
@@ -39,9 +39,50 @@ def section_header(title: str, subtitle: str = None):
     content = title
     if subtitle:
         content += f"\n[dim]{subtitle}[/dim]"
-    console.print()
-    console.print(Panel(content, style="bold cyan", expand=True))
-    console.print()
+    # Buffer the three prints so the header reaches the terminal in one write
+    with console:
+        console.print()
+        console.print(Panel(content, style="bold cyan", expand=True))
+        console.print()
+
+
+class ConsoleBuffer:
+    """
+    Collect console lines and print them in batches.
+
+    Every console.print() parses markup, renders and writes to the terminal
+    on its own; loops that report one line per file can print through this
+    buffer instead, which joins the lines and prints them every
+    *flush_interval* lines and when the block exits.
+
+    Usage:
+        with ConsoleBuffer() as out:
+            for video in videos:
+                out.print(f"[success]\u2713[/success] Deleted: {video.name}")
+    """
+
+    def __init__(self, target: Console = None, flush_interval: int = 64):
+        self.target = target or console
+        self.flush_interval = flush_interval
+        self._lines = []
+
+    def print(self, line: str = "") -> None:
+        """Queue one line of markup, flushing if the batch is full."""
+        self._lines.append(line)
+        if len(self._lines) >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Print all queued lines in one call."""
+        if self._lines:
+            self.target.print("\n".join(self._lines))
+            self._lines.clear()
+
+    def __enter__(self) -> "ConsoleBuffer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
 
 
 def success(message: str):
@@ -64,6 +105,23 @@ def info(message: str):
     console.print(f"[info]\u2139[/info] {message}")
 
 
+def description_width() -> int:
+    """Width available for a filename in a progress-bar description.
+
+    Queries the terminal, so loops that label many files should call this
+    once and pass the result to fit_filename().
+    """
+    # Fixed columns in queue/encoding progress:
+    #   spinner(2) + bar(20) + task%(4) + speed(8) + eta(14) + separators(6) = 54
+    # Leave the rest for the description column.  The description
+    # includes a prefix ("Download: " ≈ 12 chars) so subtract that too.
+    try:
+        term_width = os.get_terminal_size().columns
+    except OSError:
+        term_width = 80
+    return max(20, term_width - 54 - 12)
+
+
 def fit_filename(name: str, width: int = 0) -> str:
     """Truncate a filename to at most *width* characters.
 
@@ -71,18 +129,10 @@ def fit_filename(name: str, width: int = 0) -> str:
     middle so the extension stays visible (e.g. ``very_long_na…encoded.mp4``).
 
     If *width* is 0 (default), a sensible value is calculated from the
-    current terminal width, leaving room for progress-bar columns.
+    current terminal width with description_width().
     """
     if width <= 0:
-        # Fixed columns in queue/encoding progress:
-        #   spinner(2) + bar(20) + task%(4) + speed(8) + eta(14) + separators(6) = 54
-        # Leave the rest for the description column.  The description
-        # includes a prefix ("Download: " ≈ 12 chars) so subtract that too.
-        try:
-            term_width = os.get_terminal_size().columns
-        except OSError:
-            term_width = 80
-        width = max(20, term_width - 54 - 12)
+        width = description_width()
     if len(name) <= width:
         return name
     # Keep extension visible: split into stem + tail
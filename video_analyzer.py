@@ -2,13 +2,69 @@
 Video analysis module for checking encoding specs and detecting issues
 """
 
+import functools
 import json
+import os
 import subprocess
+import threading
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Optional, List, Any
+from typing import Dict, Iterator, Optional, List, Any
 from dataclasses import dataclass, asdict
 
 
+# Only the fields VideoInfo and the QuickLook check read. Asking ffprobe for
+# these alone keeps tags, dispositions and side data out of the JSON, so there
+# is far less to emit, pipe and parse per file.
+FFPROBE_ENTRIES = (
+    'format=format_name,duration,bit_rate,size'
+    ':stream=codec_type,codec_name,codec_tag_string,width,height,pix_fmt,'
+    'avg_frame_rate,r_frame_rate'
+)
+
+
+def _ffprobe_command(file_path) -> List[str]:
+    """Build the ffprobe command shared by metadata and QuickLook probing"""
+    return [
+        'ffprobe',
+        '-v', 'quiet',
+        '-print_format', 'json',
+        '-show_entries', FFPROBE_ENTRIES,
+        str(file_path)
+    ]
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_ffprobe(path_str: str, mtime_ns: int, size: int) -> subprocess.CompletedProcess:
+    """Run ffprobe once per file version; keyed on stat so edits re-probe"""
+    return subprocess.run(_ffprobe_command(path_str), capture_output=True, timeout=30)
+
+
+def _run_ffprobe(file_path: Path, stat: Optional[os.stat_result] = None) -> subprocess.CompletedProcess:
+    """
+    Probe a file, reusing the output when the same unchanged file was already
+    probed this run (get_video_info and check_quicklook_compatibility both
+    need it, and a reporting pass usually calls both). Pass stat when the
+    caller already has it.
+    """
+    if stat is None:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return subprocess.run(_ffprobe_command(file_path), capture_output=True, timeout=30)
+    return _cached_ffprobe(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_extensions(file_types: frozenset) -> frozenset:
+    """Map user-supplied extensions ('MP4', '.mkv', ' avi') to '.ext' suffixes"""
+    return frozenset(
+        f'.{ext.strip().lower().lstrip(".")}'
+        for ext in file_types
+        if ext.strip()
+    )
+
+
 @dataclass
 class VideoInfo:
     """Container for video file information"""
@@ -27,6 +83,18 @@ class VideoInfo:
     file_size: int = 0
     is_valid: bool = True
     error_message: Optional[str] = None
+    # Raw ffprobe fields kept so the QuickLook and issue checks can run
+    # without a second probe. None on entries cached before these were recorded.
+    format_name: Optional[str] = None
+    codec_name: Optional[str] = None
+    codec_tag: Optional[str] = None
+    pix_fmt: Optional[str] = None
+    avg_frame_rate: Optional[str] = None
+
+    @functools.cached_property
+    def codec_lower(self) -> str:
+        """Lower-cased codec name, computed once per info for table lookups"""
+        return self.codec.lower()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -48,13 +116,26 @@ class VideoInfo:
 class VideoCache:
     """Simple JSON-based cache for video analysis results"""
 
-    def __init__(self, cache_file: Path):
+    def __init__(self, cache_file: Path, refresh: bool = False):
+        """
+        Args:
+            cache_file: JSON file holding the cache
+            refresh: Ignore entries from earlier runs so every file is probed
+                     again; fresh results still replace them on disk
+        """
         self.cache_file = cache_file
         self.cache: Dict[str, Dict[str, Any]] = {}
+        self.refresh = refresh
+        # Keys written this session (the only ones served in refresh mode)
+        self._fresh_keys = set()
+        self._fresh_integrity_keys = set()
         self.modified = False
         self.updates_count = 0
         self.hits = 0
         self.misses = 0
+        # Analysis probes files from worker threads; the lock keeps a periodic
+        # save from serializing the dict while another thread inserts into it
+        self._lock = threading.RLock()
         self.load()
 
     def load(self):
@@ -69,60 +150,120 @@ class VideoCache:
 
     def save(self):
         """Save cache to disk"""
-        if not self.modified:
-            return
+        with self._lock:
+            if not self.modified:
+                return
 
-        try:
-            # Atomic write pattern
-            temp_file = self.cache_file.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(self.cache, f, separators=(',', ':'))
-            temp_file.replace(self.cache_file)
-            self.modified = False
-            self.updates_count = 0
-        except Exception as e:
-            import sys
-            print(f"Warning: Failed to save cache: {e}", file=sys.stderr)
+            try:
+                # Atomic write pattern
+                temp_file = self.cache_file.with_suffix('.tmp')
+                with open(temp_file, 'w') as f:
+                    json.dump(self.cache, f, separators=(',', ':'))
+                temp_file.replace(self.cache_file)
+                self.modified = False
+                self.updates_count = 0
+            except Exception as e:
+                import sys
+                print(f"Warning: Failed to save cache: {e}", file=sys.stderr)
 
-    def get(self, file_path: Path) -> Optional[VideoInfo]:
-        """Get cached info if valid"""
+    def get(self, file_path: Path, stat: Optional[os.stat_result] = None) -> Optional[VideoInfo]:
+        """Get cached info if valid (pass stat when the caller already has it)"""
         key = str(file_path.absolute())
         entry = self.cache.get(key)
+        if self.refresh and key not in self._fresh_keys:
+            entry = None
 
         if not entry:
-            self.misses += 1
+            with self._lock:
+                self.misses += 1
             return None
 
         try:
-            stat = file_path.stat()
+            if stat is None:
+                stat = file_path.stat()
             # Use file size as the primary cache key — video files are large enough
             # that a size match is essentially a content match. Mtime alone is
             # unreliable because NAS media scanners, backup tools, and filesystem
             # maintenance routinely touch files without modifying content.
-            if entry.get('size') == stat.st_size:
-                self.hits += 1
+            if entry.get('size') == stat.st_size and 'info' in entry:
+                with self._lock:
+                    self.hits += 1
                 return VideoInfo.from_dict(entry['info'])
         except OSError:
             pass
 
-        self.misses += 1
+        with self._lock:
+            self.misses += 1
         return None
 
-    def set(self, file_path: Path, info: VideoInfo):
+    def set(self, file_path: Path, info: VideoInfo, stat: Optional[os.stat_result] = None):
         """Update cache entry"""
         try:
-            stat = file_path.stat()
+            if stat is None:
+                stat = file_path.stat()
             key = str(file_path.absolute())
-            self.cache[key] = {
-                'size': stat.st_size,
-                'info': info.to_dict()
-            }
-            self.modified = True
-            self.updates_count += 1
+            with self._lock:
+                entry = {
+                    'size': stat.st_size,
+                    'info': info.to_dict()
+                }
+                # Deep-scan results for the same file version stay valid
+                old = self.cache.get(key)
+                if old and old.get('size') == stat.st_size and 'integrity' in old:
+                    entry['integrity'] = old['integrity']
+                self.cache[key] = entry
+                self._fresh_keys.add(key)
+                self.modified = True
+                self.updates_count += 1
+
+                # Auto-save periodically (every 100 new entries)
+                if self.updates_count >= 100:
+                    self.save()
+        except OSError:
+            pass
 
-            # Auto-save periodically (every 100 new entries)
-            if self.updates_count >= 100:
-                self.save()
+    def get_integrity(self, file_path: Path, stat: Optional[os.stat_result] = None) -> Optional[List[Dict[str, str]]]:
+        """
+        Get cached deep-scan results if the file is unchanged
+
+        Returns:
+            List of issue dicts (issue_type, severity, description), empty
+            for a clean file, or None if the file hasn't been deep-scanned
+        """
+        key = str(file_path.absolute())
+        entry = self.cache.get(key)
+        if not entry or 'integrity' not in entry:
+            return None
+        if self.refresh and key not in self._fresh_integrity_keys:
+            return None
+        try:
+            if stat is None:
+                stat = file_path.stat()
+        except OSError:
+            return None
+        if entry.get('size') != stat.st_size:
+            return None
+        return entry['integrity']
+
+    def set_integrity(self, file_path: Path, issues: List[Dict[str, str]],
+                      stat: Optional[os.stat_result] = None):
+        """Store deep-scan results alongside the file's metadata"""
+        try:
+            if stat is None:
+                stat = file_path.stat()
+            key = str(file_path.absolute())
+            with self._lock:
+                entry = self.cache.get(key)
+                if not entry or entry.get('size') != stat.st_size:
+                    entry = {'size': stat.st_size}
+                    self.cache[key] = entry
+                entry['integrity'] = issues
+                self._fresh_integrity_keys.add(key)
+                self.modified = True
+                self.updates_count += 1
+
+                if self.updates_count >= 100:
+                    self.save()
         except OSError:
             pass
 
@@ -159,8 +300,24 @@ class VideoAnalyzer:
     # Modern codec standards - includes all variations and tags
     MODERN_CODECS = {'hevc', 'h265', 'hvc1', 'hev1', 'av1', 'av01', 'vp9', 'vp09'}
     ACCEPTABLE_CODECS = {'h264', 'avc', 'avc1', 'hevc', 'h265', 'hvc1', 'hev1', 'av1', 'av01', 'vp9', 'vp09'}
+    # Codec tags specific enough to report instead of ffprobe's codec_name
+    RECOGNIZED_CODEC_TAGS = MODERN_CODECS | ACCEPTABLE_CODECS
 
-    def __init__(self, verbose: bool = False, max_resolution: Optional[tuple] = None, use_cache: bool = True):
+    # Containers accepted by meets_modern_specs (mov and mp4 are essentially
+    # the same - both MPEG-4 Part 14)
+    MODERN_CONTAINERS = {'mp4', 'mov', 'mkv', 'matroska', 'webm'}
+
+    # NAS/OS housekeeping folders skipped during recursive scans. Synology's
+    # @eaDir holds generated preview clips that would otherwise show up as videos.
+    SKIP_DIRS = {'@eaDir', '#recycle', '$RECYCLE.BIN', '.Trash', '.Trashes', '.AppleDouble'}
+
+    def __init__(
+        self,
+        verbose: bool = False,
+        max_resolution: Optional[tuple] = None,
+        use_cache: bool = True,
+        refresh_cache: bool = False
+    ):
         """
         Initialize VideoAnalyzer
 
@@ -170,6 +327,7 @@ class VideoAnalyzer:
                           Videos exceeding this will be marked as non-compliant.
                           E.g., (1920, 1080) for 1080p maximum.
             use_cache: Enable caching of analysis results (default: True)
+            refresh_cache: Re-probe files even when cached, updating the cache
         """
         self.verbose = verbose
         self.max_resolution = max_resolution
@@ -180,7 +338,7 @@ class VideoAnalyzer:
             # Use a hidden file in the user's home directory for global caching
             try:
                 cache_path = Path.home() / '.video_sentinel_cache.json'
-                self.cache = VideoCache(cache_path)
+                self.cache = VideoCache(cache_path, refresh=refresh_cache)
             except Exception as e:
                 if self.verbose:
                     print(f"Warning: Could not initialize cache: {e}")
@@ -214,49 +372,48 @@ class VideoAnalyzer:
         Returns:
             VideoInfo object or None if file cannot be analyzed
         """
-        if not file_path.exists():
+        # One stat serves as the existence check and the cache validation
+        try:
+            stat = file_path.stat()
+        except OSError:
             return None
 
         # Check cache first
         if self.cache:
-            cached_info = self.cache.get(file_path)
+            cached_info = self.cache.get(file_path, stat)
             if cached_info:
                 return cached_info
 
         # Probe file
-        info = self._probe_video_info(file_path)
+        info = self._probe_video_info(file_path, stat)
 
         # Cache result
         if info and self.cache:
-            self.cache.set(file_path, info)
+            self.cache.set(file_path, info, stat)
 
         return info
 
-    def _probe_video_info(self, file_path: Path) -> Optional[VideoInfo]:
+    def _probe_video_info(self, file_path: Path, stat: Optional[os.stat_result] = None) -> Optional[VideoInfo]:
         """
         Internal method to extract video information using ffprobe without caching
 
         Args:
             file_path: Path to video file
+            stat: Optional stat of file_path the caller already made
 
         Returns:
             VideoInfo object or None if file cannot be analyzed
         """
-        if not file_path.exists():
-            return None
+        # The stat doubles as the existence check and the ffprobe output key
+        if stat is None:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                return None
 
         try:
             # Use ffprobe to get video metadata
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format',
-                '-show_streams',
-                str(file_path)
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = _run_ffprobe(file_path, stat)
 
             if result.returncode != 0:
                 return VideoInfo(
@@ -271,9 +428,10 @@ class VideoAnalyzer:
                     fps=0.0,
                     has_audio=False,
                     is_valid=False,
-                    error_message=f"ffprobe failed: {result.stderr}"
+                    error_message=f"ffprobe failed: {result.stderr.decode(errors='replace')}"
                 )
 
+            # json.loads takes the raw bytes directly; no text-mode decode pass
             data = json.loads(result.stdout)
 
             # Find video and audio streams
@@ -312,7 +470,7 @@ class VideoAnalyzer:
 
             # Use codec tag if it provides more specific info (e.g., hvc1 instead of hevc)
             # But only if it's a recognized codec variant
-            if codec_tag and codec_tag in self.MODERN_CODECS | self.ACCEPTABLE_CODECS:
+            if codec_tag and codec_tag in self.RECOGNIZED_CODEC_TAGS:
                 codec = codec_tag
 
             width = int(video_stream.get('width', 0))
@@ -366,7 +524,12 @@ class VideoAnalyzer:
                 audio_codec=audio_codec,
                 audio_stream_count=audio_stream_count,
                 file_size=file_size,
-                is_valid=True
+                is_valid=True,
+                format_name=format_info.get('format_name', ''),
+                codec_name=video_stream.get('codec_name', ''),
+                codec_tag=video_stream.get('codec_tag_string', ''),
+                pix_fmt=video_stream.get('pix_fmt', ''),
+                avg_frame_rate=video_stream.get('avg_frame_rate', '0/1')
             )
 
         except subprocess.TimeoutExpired:
@@ -400,12 +563,18 @@ class VideoAnalyzer:
                 error_message=str(e)
             )
 
-    def check_quicklook_compatibility(self, file_path: Path) -> Dict[str, any]:
+    def check_quicklook_compatibility(
+        self,
+        file_path: Path,
+        video_info: Optional[VideoInfo] = None
+    ) -> Dict[str, any]:
         """
         Check if video is compatible with macOS QuickLook
 
         Args:
             file_path: Path to video file
+            video_info: Optional VideoInfo already gathered for this file; when
+                        it carries the raw stream fields, no ffprobe is run
 
         Returns:
             Dict with compatibility info: {
@@ -415,22 +584,17 @@ class VideoAnalyzer:
                 'needs_reencode': bool  # Needs full re-encode
             }
         """
-        issues = []
-        needs_remux = False
-        needs_reencode = False
+        if video_info is not None and video_info.is_valid and video_info.format_name is not None:
+            return self._quicklook_verdict(
+                video_info.format_name,
+                video_info.codec_name or '',
+                video_info.codec_tag or '',
+                video_info.pix_fmt or ''
+            )
 
         try:
             # Get detailed stream info
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format',
-                '-show_streams',
-                str(file_path)
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = _run_ffprobe(file_path)
             if result.returncode != 0:
                 return {'compatible': False, 'issues': ['Cannot analyze file'], 'needs_remux': False, 'needs_reencode': False}
 
@@ -447,59 +611,71 @@ class VideoAnalyzer:
             if not video_stream:
                 return {'compatible': False, 'issues': ['No video stream'], 'needs_remux': False, 'needs_reencode': False}
 
-            # Check 1: Container should be MP4
-            container = format_info.get('format_name', '').lower()
-            if 'mp4' not in container and 'mov' not in container:
-                issues.append(f"Container is {container}, should be MP4")
-                needs_remux = True
-
-            # Check 2: Codec must be H.264, HEVC, or AV1 for QuickLook
-            # AV1 supported in macOS Ventura 13+ (hardware decode on M3+)
-            codec_name = video_stream.get('codec_name', '').lower()
-            supported_codecs = ['h264', 'avc1', 'hevc', 'h265', 'av1', 'mpeg4']
-            if codec_name not in supported_codecs:
-                issues.append(f"Codec is {codec_name}, should be H.264, HEVC, or AV1 for QuickLook")
-                needs_reencode = True
-
-            # Check 3: For HEVC, check codec tag (should be hvc1, not hev1)
-            codec_tag = video_stream.get('codec_tag_string', '').lower()
-
-            if codec_name in ['hevc', 'h265']:
-                if codec_tag != 'hvc1':
-                    issues.append(f"HEVC tag is {codec_tag}, should be hvc1 for QuickLook")
-                    needs_remux = True  # Tag change only needs remux, not re-encode
-
-            # Check 4: Pixel format compatibility
-            # macOS QuickLook supports 10-bit HEVC natively (since High Sierra),
-            # and 10-bit AV1 natively (since Ventura).
-            # Only force re-encode for truly unsupported pixel formats.
-            pix_fmt = video_stream.get('pix_fmt', '').lower()
-            if pix_fmt and pix_fmt != 'yuv420p':
-                # HEVC and AV1 support 10-bit 4:2:0 in QuickLook via hardware decoder
-                ten_bit_compatible_fmts = {'yuv420p', 'yuv420p10le', 'yuv420p10be'}
-                if codec_name in ['hevc', 'h265', 'av1'] and pix_fmt in ten_bit_compatible_fmts:
-                    pass  # 10-bit HEVC/AV1 is QuickLook compatible, no action needed
-                else:
-                    issues.append(f"Pixel format is {pix_fmt}, needs re-encode for QuickLook")
-                    needs_reencode = True
-
-            # Check 4: Faststart flag (check if moov atom is at the beginning)
-            # This is harder to check programmatically, but we can infer from format tags
-            format_tags = format_info.get('tags', {})
-            # Note: ffprobe doesn't directly show faststart, but we can recommend it
-
-            compatible = len(issues) == 0
-
-            return {
-                'compatible': compatible,
-                'issues': issues,
-                'needs_remux': needs_remux and not needs_reencode,  # Only remux if no re-encode needed
-                'needs_reencode': needs_reencode
-            }
+            return self._quicklook_verdict(
+                format_info.get('format_name', ''),
+                video_stream.get('codec_name', ''),
+                video_stream.get('codec_tag_string', ''),
+                video_stream.get('pix_fmt', '')
+            )
 
         except Exception as e:
             return {'compatible': False, 'issues': [f"Error: {str(e)}"], 'needs_remux': False, 'needs_reencode': False}
 
+    @staticmethod
+    def _quicklook_verdict(format_name: str, codec_name: str, codec_tag: str, pix_fmt: str) -> Dict[str, any]:
+        """Apply the QuickLook rules to raw ffprobe container/stream fields"""
+        issues = []
+        needs_remux = False
+        needs_reencode = False
+
+        # Check 1: Container should be MP4
+        container = format_name.lower()
+        if 'mp4' not in container and 'mov' not in container:
+            issues.append(f"Container is {container}, should be MP4")
+            needs_remux = True
+
+        # Check 2: Codec must be H.264, HEVC, or AV1 for QuickLook
+        # AV1 supported in macOS Ventura 13+ (hardware decode on M3+)
+        codec_name = codec_name.lower()
+        supported_codecs = ['h264', 'avc1', 'hevc', 'h265', 'av1', 'mpeg4']
+        if codec_name not in supported_codecs:
+            issues.append(f"Codec is {codec_name}, should be H.264, HEVC, or AV1 for QuickLook")
+            needs_reencode = True
+
+        # Check 3: For HEVC, check codec tag (should be hvc1, not hev1)
+        codec_tag = codec_tag.lower()
+
+        if codec_name in ['hevc', 'h265']:
+            if codec_tag != 'hvc1':
+                issues.append(f"HEVC tag is {codec_tag}, should be hvc1 for QuickLook")
+                needs_remux = True  # Tag change only needs remux, not re-encode
+
+        # Check 4: Pixel format compatibility
+        # macOS QuickLook supports 10-bit HEVC natively (since High Sierra),
+        # and 10-bit AV1 natively (since Ventura).
+        # Only force re-encode for truly unsupported pixel formats.
+        pix_fmt = pix_fmt.lower()
+        if pix_fmt and pix_fmt != 'yuv420p':
+            # HEVC and AV1 support 10-bit 4:2:0 in QuickLook via hardware decoder
+            ten_bit_compatible_fmts = {'yuv420p', 'yuv420p10le', 'yuv420p10be'}
+            if codec_name in ['hevc', 'h265', 'av1'] and pix_fmt in ten_bit_compatible_fmts:
+                pass  # 10-bit HEVC/AV1 is QuickLook compatible, no action needed
+            else:
+                issues.append(f"Pixel format is {pix_fmt}, needs re-encode for QuickLook")
+                needs_reencode = True
+
+        # Note: faststart (moov atom placement) isn't reported by ffprobe,
+        # so it is recommended rather than checked
+
+        compatible = len(issues) == 0
+
+        return {
+            'compatible': compatible,
+            'issues': issues,
+            'needs_remux': needs_remux and not needs_reencode,  # Only remux if no re-encode needed
+            'needs_reencode': needs_reencode
+        }
+
     def meets_modern_specs(self, video_info: VideoInfo) -> bool:
         """
         Check if video meets modern encoding specifications
@@ -514,12 +690,11 @@ class VideoAnalyzer:
             return False
 
         # Check codec
-        codec_lower = video_info.codec.lower()
-        if codec_lower not in self.MODERN_CODECS:
+        if video_info.codec_lower not in self.MODERN_CODECS:
             return False
 
-        # Check container (mov and mp4 are essentially the same - both MPEG-4 Part 14)
-        if video_info.container not in {'mp4', 'mov', 'mkv', 'matroska', 'webm'}:
+        # Check container
+        if video_info.container not in self.MODERN_CONTAINERS:
             return False
 
         # Video should have valid dimensions
@@ -539,7 +714,8 @@ class VideoAnalyzer:
         self,
         directory: Path,
         recursive: bool = False,
-        file_types: Optional[List[str]] = None
+        file_types: Optional[List[str]] = None,
+        max_files: Optional[int] = None
     ) -> List[Path]:
         """
         Find all video files in a directory
@@ -549,38 +725,105 @@ class VideoAnalyzer:
             recursive: Whether to scan recursively
             file_types: Optional list of file extensions to filter (e.g., ['wmv', 'avi', 'mov'])
                        If None, uses all VIDEO_EXTENSIONS
+            max_files: Optional limit; returns the same files as slicing the
+                       full sorted result, but stops walking once it has them
 
         Returns:
             List of video file paths
         """
-        video_files = []
+        if max_files is not None:
+            extensions = self._search_suffixes(file_types)
+            if extensions is None:
+                return []
+            return list(islice(self._iter_videos_sorted(directory, recursive, extensions), max_files))
+        return sorted(self.iter_videos(directory, recursive, file_types))
 
+    def _iter_videos_sorted(self, directory: Path, recursive: bool, extensions: tuple) -> Iterator[Path]:
+        """
+        Depth-first walk yielding video files in sorted path order
+
+        Files and subdirectories of each directory are visited together in
+        name order, which is exactly the order sorted() puts their paths in,
+        so a caller can stop after the first N without listing the rest of
+        the tree. Mirrors iter_videos' filtering (SKIP_DIRS, '._' files, no
+        symlinked directories) and, like os.walk, skips unreadable
+        subdirectories.
+        """
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir():
+                if recursive and name not in self.SKIP_DIRS and not entry.is_symlink():
+                    try:
+                        yield from self._iter_videos_sorted(directory / name, recursive, extensions)
+                    except OSError:
+                        continue
+            elif name.lower().endswith(extensions) and not name.startswith('._') and entry.is_file():
+                yield directory / name
+
+    def _search_suffixes(self, file_types: Optional[List[str]]) -> Optional[tuple]:
+        """Dotted lowercase suffixes to match, or None if file_types has no video extension"""
+        if not file_types:
+            return tuple(self.VIDEO_EXTENSIONS)
+        # Normalize once per distinct filter (one walk per path argument
+        # would otherwise redo it), then keep only valid video extensions
+        search_extensions = _normalize_extensions(frozenset(file_types)) & self.VIDEO_EXTENSIONS
+        if not search_extensions:
+            # No valid video extensions provided
+            if self.verbose:
+                print(f"Warning: No valid video extensions in file_types: {file_types}")
+            return None
+        return tuple(search_extensions)
+
+    def iter_videos(
+        self,
+        directory: Path,
+        recursive: bool = False,
+        file_types: Optional[List[str]] = None
+    ) -> Iterator[Path]:
+        """
+        Yield video files as the directory walk discovers them (unsorted)
+
+        Lets callers start probing the first files while the rest of a large
+        (often network-mounted) tree is still being listed. Use find_videos
+        when a sorted, complete list is needed.
+
+        Args:
+            directory: Directory to scan
+            recursive: Whether to scan recursively
+            file_types: Optional list of file extensions to filter (e.g., ['wmv', 'avi', 'mov'])
+                       If None, uses all VIDEO_EXTENSIONS
+
+        Yields:
+            Video file paths
+        """
         # Determine which extensions to search for
-        if file_types:
-            # Normalize extensions (remove dots, convert to lowercase, add dot prefix)
-            extensions = {
-                f'.{ext.strip().lower().lstrip(".")}'
-                for ext in file_types
-            }
-            # Filter to only valid video extensions
-            search_extensions = extensions & self.VIDEO_EXTENSIONS
-            if not search_extensions:
-                # No valid video extensions provided
-                if self.verbose:
-                    print(f"Warning: No valid video extensions in file_types: {file_types}")
-                return []
-        else:
-            search_extensions = self.VIDEO_EXTENSIONS
+        extensions = self._search_suffixes(file_types)
+        if extensions is None:
+            return
 
         # Single directory traversal — filter by extension in Python.
         # Much faster than running a separate glob per extension (48+ passes).
+        # str.endswith() with a tuple checks every extension in C without
+        # building a suffix string per entry; the cheap name test runs first
+        # so is_file() only stats entries that look like videos.
         if recursive:
-            for entry in directory.rglob('*'):
-                if entry.is_file() and not entry.name.startswith('._') and entry.suffix.lower() in search_extensions:
-                    video_files.append(entry)
+            # os.walk sorts entries into dirs and non-dirs from the scandir
+            # d_type. Non-dirs also include dangling symlinks, FIFOs and the
+            # like, so names with a video extension are checked to be regular
+            # files (following symlinks); other names cost no stat.
+            for root, dirs, files in os.walk(directory):
+                dirs[:] = [d for d in dirs if d not in self.SKIP_DIRS]
+                root_path = Path(root)
+                for name in files:
+                    if name.lower().endswith(extensions) and not name.startswith('._'):
+                        path = root_path / name
+                        if os.path.isfile(path):
+                            yield path
         else:
-            for entry in directory.iterdir():
-                if entry.is_file() and not entry.name.startswith('._') and entry.suffix.lower() in search_extensions:
-                    video_files.append(entry)
-
-        return sorted(video_files)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.lower().endswith(extensions) and not name.startswith('._') and entry.is_file():
+                        yield directory / name
@@ -11,23 +11,71 @@ Features:
 
 import argparse
 import fcntl
+import functools
 import os
+import re
 import sys
+from collections import Counter
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Container, Dict, Iterable, Iterator, List, Optional
 
 from video_analyzer import VideoAnalyzer, VideoInfo
-from duplicate_detector import DuplicateDetector
-from issue_detector import IssueDetector
-from encoder import VideoEncoder
-from network_queue_manager import NetworkQueueManager
+from encoder import VideoEncoder, available_cpu_count, list_directory_names
 from shutdown_manager import start_shutdown_listener, stop_shutdown_listener, shutdown_requested
-from stats import StatsCollector
-from sample_generator import create_sample_video
-from ui import console, section_header, success, error, warning, create_scan_progress, create_batch_progress, fit_filename, create_replacement_table, format_size
-
-
-def rank_video_quality(video_path: Path, video_info: VideoInfo, analyzer: VideoAnalyzer = None) -> int:
+from ui import console, ConsoleBuffer, section_header, success, error, warning, create_scan_progress, create_batch_progress, description_width, fit_filename, create_replacement_table, format_size
+
+
+# Issue report markers by severity
+SEVERITY_SYMBOLS = {'critical': '\u2717', 'warning': '\u26a0', 'info': '\u2139'}
+SEVERITY_STYLES = {'critical': 'error', 'warning': 'warning', 'info': 'info'}
+
+
+# Duplicate ranking: codec -> (modernity score, bitrate efficiency relative to
+# H.264 in tenths). Modern codecs need less bitrate for the same quality, so
+# bitrates are scaled by efficiency to compare them as H.264 equivalents.
+# Tenths keep the scoring in integer arithmetic.
+_CODEC_INFO = {
+    'av1': (1000, 25),    # AV1 is ~2.5x more efficient than H.264
+    'vp9': (900, 20),     # VP9 is ~2x more efficient than H.264
+    'hevc': (800, 20),    # HEVC is ~2x more efficient than H.264
+    'hvc1': (800, 20),    # HEVC variant (macOS QuickLook compatible)
+    'h265': (800, 20),    # HEVC alternate name
+    'h264': (400, 10),    # Baseline
+    'avc1': (400, 10),    # H.264 variant
+    'avc': (400, 10),     # H.264 variant
+    'mpeg4': (200, 6),    # MPEG4 is less efficient than H.264
+    'mpeg2': (100, 4),    # MPEG2 is much less efficient
+    'wmv': (50, 5),       # Old codecs are less efficient
+    'xvid': (50, 6),
+}
+
+# Container preference (MP4 > MKV > others for compatibility)
+_CONTAINER_BONUS = {
+    '.mp4': 300,
+    '.m4v': 300,
+    '.mkv': 100,
+    '.webm': 100,
+}
+
+# Whitespace (including stray CR/LF from terminals left in raw mode) dropped
+# from typed confirmations
+_STRIP_WS = str.maketrans('', '', '\r\n\t ')
+
+# Suffixes our own outputs carry, with their lengths for slicing them off
+_PROCESSED_SUFFIXES = tuple((suffix, len(suffix)) for suffix in ('_reencoded', '_quicklook'))
+
+# Finds either suffix anywhere in a stem, in any case, in one scan
+_PROCESSED_MARKER = re.compile(r'_(?:quicklook|reencoded)', re.IGNORECASE).search
+
+
+def rank_video_quality(
+    video_path: Path,
+    video_info: VideoInfo,
+    analyzer: VideoAnalyzer = None,
+    ql_compatible: Optional[bool] = None
+) -> int:
     """
     Rank video quality for duplicate selection
     Higher score = better quality
@@ -38,83 +86,268 @@ def rank_video_quality(video_path: Path, video_info: VideoInfo, analyzer: VideoA
     - Bitrate (normalized by codec efficiency)
     - QuickLook compatibility (macOS)
     - Recent processing (newly encoded files)
+
+    Pass ql_compatible when the QuickLook check has already been run;
+    otherwise it is checked through analyzer (if given).
     """
     score = 0
 
+    # One lookup gives both the codec score and its bitrate efficiency
+    codec_score, efficiency_tenths = _CODEC_INFO.get(video_info.codec_lower, (0, 10))
+
     # Codec scoring (modern codecs are better)
-    codec_scores = {
-        'av1': 1000,
-        'vp9': 900,
-        'hevc': 800,
-        'hvc1': 800,  # HEVC variant (macOS QuickLook compatible)
-        'h265': 800,
-        'h264': 400,
-        'avc1': 400,  # H.264 variant
-        'avc': 400,   # H.264 variant
-        'mpeg4': 200,
-        'mpeg2': 100,
-        'wmv': 50,
-        'xvid': 50,
-    }
-    score += codec_scores.get(video_info.codec.lower(), 0)
+    score += codec_score
 
     # Resolution scoring (pixels)
     score += video_info.width * video_info.height // 1000
 
     # Bitrate scoring - normalized by codec efficiency
-    # Modern codecs need less bitrate for same quality, so we normalize to H.264 equivalent
-    codec_efficiency = {
-        'av1': 2.5,    # AV1 is ~2.5x more efficient than H.264
-        'vp9': 2.0,    # VP9 is ~2x more efficient than H.264
-        'hevc': 2.0,   # HEVC is ~2x more efficient than H.264
-        'hvc1': 2.0,   # HEVC variant
-        'h265': 2.0,   # HEVC alternate name
-        'h264': 1.0,   # Baseline
-        'avc1': 1.0,   # H.264 variant
-        'avc': 1.0,    # H.264 variant
-        'mpeg4': 0.6,  # MPEG4 is less efficient than H.264
-        'mpeg2': 0.4,  # MPEG2 is much less efficient
-        'wmv': 0.5,    # Old codecs are less efficient
-        'xvid': 0.6,
-    }
-
-    efficiency = codec_efficiency.get(video_info.codec.lower(), 1.0)
-    # Normalize bitrate to H.264 equivalent (multiply by efficiency factor)
-    normalized_bitrate = video_info.bitrate * efficiency
-    score += int(normalized_bitrate // 10000)
+    # Modern codecs need less bitrate for same quality, so we normalize to H.264 equivalent.
+    # ffprobe reports 0 when the bitrate is unknown (common on damaged files).
+    if video_info.bitrate:
+        score += video_info.bitrate * efficiency_tenths // 100000
 
     # Newly processed file bonus (HIGHEST PRIORITY - always prefer over originals)
     # Files with _quicklook or _reencoded suffixes are newly processed
     # This bonus is intentionally VERY high to ensure newly processed files
     # always beat originals, even if original is 4K and new file is 1080p
-    stem_lower = video_path.stem.lower()
-    if '_quicklook' in stem_lower or '_reencoded' in stem_lower:
+    if _PROCESSED_MARKER(video_path.stem):
         score += 50000  # Massive bonus to heavily favor newly processed files
 
     # QuickLook compatibility bonus (significant advantage for macOS users)
-    if analyzer:
-        compat = analyzer.check_quicklook_compatibility(video_path)
-        if compat.get('compatible'):
-            score += 5000  # Big bonus for QuickLook compatible files
+    if ql_compatible is None and analyzer:
+        ql_compatible = analyzer.check_quicklook_compatibility(video_path, video_info=video_info).get('compatible')
+    if ql_compatible:
+        score += 5000  # Big bonus for QuickLook compatible files
 
     # Container preference (MP4 > MKV > others for compatibility)
-    container_bonus = {
-        '.mp4': 300,
-        '.m4v': 300,
-        '.mkv': 100,
-        '.webm': 100,
-    }
-    score += container_bonus.get(video_path.suffix.lower(), 0)
+    score += _CONTAINER_BONUS.get(video_path.suffix.lower(), 0)
 
     return score
 
 
+def iter_file_list(file_list: Path, extensions: Iterable[str], verbose: bool = False) -> Iterator[Path]:
+    """
+    Yield the video files named in a file list, one path per line
+
+    Lines are read lazily, so a caller that only needs the first N entries
+    never reads or stats the rest of a long list.
+
+    Args:
+        file_list: Text file with one video path per line
+        extensions: Accepted video extensions (with leading dot, lowercase)
+        verbose: Report entries that are skipped
+
+    Yields:
+        Paths that have a video extension and exist as regular files
+    """
+    with open(file_list, 'r') as f:
+        for line in f:
+            path_str = line.strip()
+            if not path_str:
+                continue
+            video_path = Path(path_str)
+            # Extension first: it's free, while is_file() is a stat call
+            if video_path.suffix.lower() in extensions and video_path.is_file():
+                yield video_path
+            elif verbose:
+                console.print(f"Skipping invalid or non-video entry in file list: {path_str}", style="dim")
+
+
+def _file_size(path: Path) -> Optional[int]:
+    """Return the size of path in bytes, or None if it can't be stat'ed"""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+
+def collect_file_sizes(paths: Iterable[Path], max_workers: int = 1) -> Dict[Path, int]:
+    """
+    Stat each path once and return its size in bytes
+
+    Duplicate handling reports, ranks and deletes the same files several
+    times over; sharing one size lookup avoids repeating the stat calls,
+    which are round trips on network storage. Paths that can't be stat'ed
+    (deleted mid-run, permissions) are left out.
+
+    Args:
+        paths: Video file paths
+        max_workers: Number of threads issuing stat calls concurrently
+
+    Returns:
+        Dict mapping each readable path to its size
+    """
+    paths = list(dict.fromkeys(paths))
+    if max_workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_file_size, paths)
+            return {path: size for path, size in zip(paths, results) if size is not None}
+
+    sizes = {}
+    for path in paths:
+        size = _file_size(path)
+        if size is not None:
+            sizes[path] = size
+    return sizes
+
+
+def _rename_if_free(
+    source: Path,
+    target: Path,
+    dir_names: Optional[Container[str]] = None
+) -> tuple[str, Optional[Exception]]:
+    """
+    Rename source to target unless target already exists
+
+    Args:
+        source: File to rename
+        target: New path
+        dir_names: Optional casefolded names in target's directory (from
+                  list_directory_names); a miss skips the stat, a hit is confirmed
+                  with exists() since case-sensitive filesystems may differ by case
+
+    Returns:
+        ('renamed', None), ('skipped', None) if target exists,
+        or ('failed', error)
+    """
+    if dir_names is not None:
+        taken = target.name.casefold() in dir_names and target.exists()
+    else:
+        taken = target.exists()
+    if taken:
+        return 'skipped', None
+    try:
+        source.rename(target)
+    except Exception as e:
+        return 'failed', e
+    return 'renamed', None
+
+
+def _replace_with_output(video_path: Path, output_path: Path) -> None:
+    """Delete the original and move its converted output to <stem>.mp4"""
+    video_path.unlink()
+    output_path.rename(video_path.with_suffix('.mp4'))
+
+
+def _info_for_copy(
+    info: Optional[VideoInfo],
+    local_path: Path,
+    analyzer: VideoAnalyzer
+) -> Optional[VideoInfo]:
+    """
+    Metadata for a queue-mode temp copy of a file probed earlier
+
+    The copy is byte-identical to its original, so the earlier VideoInfo is
+    reused when the sizes agree. A mismatch (two originals with the same
+    name, or a file changed since it was probed) means probing the copy.
+    """
+    if info is not None:
+        if not info.file_size:
+            return info
+        try:
+            if local_path.stat().st_size == info.file_size:
+                return info
+        except OSError:
+            pass
+    return analyzer.get_video_info(local_path)
+
+
+def list_directories(
+    directories: Iterable[Path],
+    executor: ThreadPoolExecutor
+) -> Dict[Path, frozenset]:
+    """
+    List each distinct directory once, concurrently
+
+    Args:
+        directories: Directories to list; repeats are listed once
+        executor: Pool to run the listings on
+
+    Returns:
+        Dict mapping each readable directory to its casefolded entry names
+    """
+    unique = list(dict.fromkeys(directories))
+    listings = executor.map(list_directory_names, unique)
+    return {
+        directory: names
+        for directory, names in zip(unique, listings)
+        if names is not None
+    }
+
+
+def _unlink(path: Path) -> Optional[OSError]:
+    """Delete path, returning the error instead of raising it"""
+    try:
+        path.unlink()
+    except OSError as e:
+        return e
+    return None
+
+
+def _perform_deletions(
+    all_to_delete: List[Path],
+    delete_to_keep_map: Dict[Path, Path],
+    size_cache: Dict[Path, int],
+    max_workers: int = 1
+) -> None:
+    """
+    Delete duplicate files and report the space freed
+
+    Args:
+        all_to_delete: Files to delete, in display order
+        delete_to_keep_map: Maps each deleted file to the copy that was kept
+        size_cache: Sizes of the deleted and kept files, from collect_file_sizes()
+        max_workers: Number of threads issuing unlink calls concurrently
+                    (each is a round trip on network storage)
+    """
+    deleted_count = 0
+    total_size_freed = 0
+    incremental_space_saved = 0
+
+    if max_workers > 1 and len(all_to_delete) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            errors = list(executor.map(_unlink, all_to_delete))
+    else:
+        errors = [_unlink(video) for video in all_to_delete]
+
+    # Report in display order once every unlink has finished
+    with ConsoleBuffer() as out:
+        for video, error in zip(all_to_delete, errors):
+            if error is not None:
+                out.print(f"  [error]\u2717[/error] Failed to delete {video.name}: {error}")
+                continue
+
+            deleted_size = size_cache.get(video, 0)
+            deleted_count += 1
+            total_size_freed += deleted_size
+
+            # Calculate incremental space saved (deleted - kept); if the kept
+            # file is gone, the whole deleted size counts
+            kept_file = delete_to_keep_map.get(video)
+            kept_size = size_cache.get(kept_file) if kept_file else None
+            if kept_size is not None:
+                incremental_space_saved += max(0, deleted_size - kept_size)
+            else:
+                incremental_space_saved += deleted_size
+
+            out.print(f"  [success]\u2713[/success] Deleted: {video.name}")
+
+    console.print()
+    console.print(f"Successfully deleted {deleted_count}/{len(all_to_delete)} files")
+    console.print(f"Total space freed: [info]{total_size_freed / (1024*1024):.2f}[/info] MB")
+    compaction_pct = (incremental_space_saved / total_size_freed * 100) if total_size_freed > 0 else 0
+    console.print(f"Incremental space saved: [info]{incremental_space_saved / (1024*1024):.2f}[/info] MB ([info]{compaction_pct:.1f}%[/info] compaction)")
+
+
 def handle_duplicate_group(
     group_name: str,
     videos: List[Path],
     analyzer: VideoAnalyzer,
     action: str,
-    verbose: bool = False
+    verbose: bool = False,
+    file_sizes: Optional[Dict[Path, int]] = None,
+    info_cache: Optional[Dict[Path, VideoInfo]] = None
 ) -> tuple[List[Path], Optional[Path]]:
     """
     Handle a duplicate group based on action
@@ -125,9 +358,14 @@ def handle_duplicate_group(
         analyzer: VideoAnalyzer instance
         action: 'report', 'interactive', or 'auto-best'
         verbose: Enable verbose output
+        file_sizes: Optional sizes from collect_file_sizes(); the group's
+                   files are stat'ed here if not given
+        info_cache: Optional VideoInfo by path shared across groups; videos
+                   missing from it are analyzed and added
 
     Returns:
-        Tuple of (videos to delete, video to keep)
+        Tuple of (videos to delete, video to keep); videos to delete is None
+        when the user stops an interactive review
     """
     to_delete = []
     to_keep = None
@@ -137,9 +375,15 @@ def handle_duplicate_group(
         return to_delete, to_keep
 
     # Get video info for all duplicates
+    if info_cache is None:
+        info_cache = {}
     video_infos = {}
     for video in videos:
-        info = analyzer.get_video_info(video)
+        info = info_cache.get(video)
+        if info is None:
+            info = analyzer.get_video_info(video)
+            if info:
+                info_cache[video] = info
         if info:
             video_infos[video] = info
 
@@ -147,34 +391,49 @@ def handle_duplicate_group(
         console.print(f"  [warning]\u26a0 Warning: Could not analyze videos in this group[/warning]")
         return to_delete, to_keep
 
-    # Rank videos by quality (including QuickLook compatibility and container preferences)
-    ranked_videos = sorted(
-        video_infos.keys(),
-        key=lambda v: rank_video_quality(v, video_infos[v], analyzer),
-        reverse=True
-    )
+    # Stat each file once; sizes are shown for several videos in both modes
+    if file_sizes is None:
+        file_sizes = collect_file_sizes(video_infos)
+
+    # Check QuickLook compatibility once per video; ranking and both display
+    # paths below all need it
+    compat_cache = {
+        video: analyzer.check_quicklook_compatibility(video, video_info=info)
+        for video, info in video_infos.items()
+    }
+
+    # Rank videos by quality (including QuickLook compatibility and container preferences).
+    # Scores are computed up front so the sort key is a plain dict lookup; the
+    # sort stays stable, so equal scores keep their discovery order.
+    scores = {
+        video: rank_video_quality(
+            video, info, ql_compatible=compat_cache[video].get('compatible', False)
+        )
+        for video, info in video_infos.items()
+    }
+    ranked_videos = sorted(video_infos, key=scores.__getitem__, reverse=True)
 
     if action == 'auto-best':
         # Keep the best, mark others for deletion
         best_video = ranked_videos[0]
         to_keep = best_video
-        to_delete = [v for v in ranked_videos if v != best_video]
+        to_delete = ranked_videos[1:]
 
         console.print(f"  [success]\u2713 Keeping:[/success] {best_video.name}")
         info = video_infos[best_video]
 
         # Check QuickLook compatibility for the kept file
-        compat = analyzer.check_quicklook_compatibility(best_video)
+        compat = compat_cache[best_video]
         ql_status = " [QuickLook \u2713]" if compat.get('compatible') else ""
 
         console.print(f"    ({info.codec.upper()}, [info]{info.width}x{info.height}[/info], [info]{info.bitrate//1000}[/info] kbps{ql_status})")
 
         for video in to_delete:
             info = video_infos[video]
-            file_size_mb = video.stat().st_size / (1024 * 1024)
+            file_size_mb = file_sizes.get(video, 0) / (1024 * 1024)
 
             # Check QuickLook compatibility for files being deleted
-            compat = analyzer.check_quicklook_compatibility(video)
+            compat = compat_cache[video]
             ql_status = " [QuickLook \u2713]" if compat.get('compatible') else ""
 
             console.print(f"  [error]\u2717 Deleting:[/error] {video.name} ([info]{file_size_mb:.2f}[/info] MB)")
@@ -182,41 +441,49 @@ def handle_duplicate_group(
 
     elif action == 'interactive':
         # Show options and let user choose
-        console.print()
-        console.print(f"[bold]{group_name}[/bold] - {len(videos)} duplicates found:")
-        console.print()
+        # The whole menu is assembled first and printed in one call
+        lines = ["", f"[bold]{group_name}[/bold] - {len(videos)} duplicates found:", ""]
 
         for idx, video in enumerate(ranked_videos, 1):
             info = video_infos[video]
-            file_size_mb = video.stat().st_size / (1024 * 1024)
+            file_size_mb = file_sizes.get(video, 0) / (1024 * 1024)
             quality_rank = "\u2605 BEST" if idx == 1 else f"  #{idx}"
 
             # Check QuickLook compatibility
-            compat = analyzer.check_quicklook_compatibility(video)
+            compat = compat_cache[video]
             ql_badge = " [QuickLook \u2713]" if compat.get('compatible') else ""
 
-            console.print(f"  {quality_rank} [{idx}] {video.name}{ql_badge}")
-            console.print(f"      Codec: {info.codec.upper()}, Resolution: [info]{info.width}x{info.height}[/info]")
-            console.print(f"      Bitrate: [info]{info.bitrate//1000}[/info] kbps, Size: [info]{file_size_mb:.2f}[/info] MB")
-            console.print()
+            lines.append(f"  {quality_rank} [{idx}] {video.name}{ql_badge}")
+            lines.append(f"      Codec: {info.codec.upper()}, Resolution: [info]{info.width}x{info.height}[/info]")
+            lines.append(f"      Bitrate: [info]{info.bitrate//1000}[/info] kbps, Size: [info]{file_size_mb:.2f}[/info] MB")
+            lines.append("")
 
-        console.print(f"Options:")
-        console.print(f"  1-{len(ranked_videos)}: Keep that video, delete others")
-        console.print(f"  0 or Enter: Keep all (no action)")
+        lines.append("Options:")
+        lines.append(f"  1-{len(ranked_videos)}: Keep that video, delete others")
+        lines.append("  0 or Enter: Keep all (no action)")
+        lines.append("  q: Stop reviewing (choices so far still apply)")
+        console.print("\n".join(lines))
         console.print()
 
-        choice = input(f"Your choice: ").strip('\r\n\t ').replace('\r', '').replace('\n', '')
+        try:
+            choice = input("Your choice: ").strip()
+        except EOFError:
+            choice = 'q'
+
+        if choice.lower() == 'q':
+            console.print(f"  [warning]\u2192 Stopping review[/warning]")
+            return None, None
 
         if choice.isdigit() and 1 <= int(choice) <= len(ranked_videos):
             keep_idx = int(choice) - 1
             keep_video = ranked_videos[keep_idx]
             to_keep = keep_video
-            to_delete = [v for v in ranked_videos if v != keep_video]
+            to_delete = ranked_videos[:keep_idx] + ranked_videos[keep_idx + 1:]
 
             console.print()
             console.print(f"  [success]\u2713 Keeping:[/success] {keep_video.name}")
             for video in to_delete:
-                file_size_mb = video.stat().st_size / (1024 * 1024)
+                file_size_mb = file_sizes.get(video, 0) / (1024 * 1024)
                 console.print(f"  [error]\u2717 Will delete:[/error] {video.name} ([info]{file_size_mb:.2f}[/info] MB)")
         else:
             console.print(f"  [warning]\u2192 No action, keeping all[/warning]")
@@ -224,26 +491,14 @@ def handle_duplicate_group(
     return to_delete, to_keep
 
 
-def main():
-    """Main entry point for VideoSentinel CLI"""
-    # Reset terminal to normal mode at startup (in case previous run left it in cbreak mode)
-    if sys.stdin.isatty():
-        try:
-            import termios
-            fd = sys.stdin.fileno()
-            # Get current settings
-            try:
-                attrs = termios.tcgetattr(fd)
-                # Enable canonical mode (ICANON) and echo (ECHO) for normal line-buffered input
-                # This reverses cbreak/raw mode settings
-                attrs[3] |= termios.ICANON | termios.ECHO  # lflag
-                termios.tcsetattr(fd, termios.TCSANOW, attrs)
-            except:
-                pass
-        except ImportError:
-            # On Windows or systems without termios, skip
-            pass
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line parser
 
+    Cached so that callers running main() repeatedly in one process (wrapper
+    scripts, tests) build the argument definitions only once.
+    """
     parser = argparse.ArgumentParser(
         description='VideoSentinel - Manage and validate your video library',
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -295,7 +550,14 @@ def main():
     parser.add_argument(
         '--ignore-duration',
         action='store_true',
-        help='Ignore video duration when checking for filename duplicates (useful if re-encoded files have slightly different lengths)'
+        help='Ignore video duration when matching duplicates: filename duplicates skip the duration check, and perceptual hashing hashes every file instead of only those with a length-compatible partner (useful if re-encoded files have slightly different lengths)'
+    )
+
+    parser.add_argument(
+        '--hw-decode',
+        action='store_true',
+        help='Decode frames for perceptual hashing with hardware acceleration (VA-API, NVDEC, VideoToolbox) '
+             'when OpenCV supports it; files that fail fall back to software decoding'
     )
 
     parser.add_argument(
@@ -376,6 +638,15 @@ def main():
              '(default: medium, or the active --profile setting)'
     )
 
+    parser.add_argument(
+        '--hwaccel',
+        choices=VideoEncoder.HWACCEL_CHOICES,
+        default='none',
+        help='Encode video on a GPU/media engine: nvenc (NVIDIA), qsv (Intel), '
+             'videotoolbox (Apple), amf (AMD), or auto to use the first one that '
+             'works. Falls back to software encoding if unavailable (default: none)'
+    )
+
     parser.add_argument(
         '--audio-codec',
         default=None,
@@ -423,6 +694,36 @@ def main():
         help='Encode N files simultaneously (default: 1). Constrains per-instance x265 threads to share CPU effectively.'
     )
 
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Analyze N files concurrently when probing metadata (default: CPUs available to this process). '
+             'Each probe is an ffprobe subprocess, so this mostly overlaps I/O.'
+    )
+
+    parser.add_argument(
+        '--remux-jobs',
+        type=int,
+        default=4,
+        metavar='N',
+        help='Run N stream-copy remuxes concurrently for --force-remux-mkv and --fix-quicklook (default: 4). '
+             'Remuxing is disk-bound, so a few at once keep the disk busy.'
+    )
+
+    parser.add_argument(
+        '--refresh-metadata',
+        action='store_true',
+        help='Re-probe every file instead of using cached metadata, and update the cache with the results'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Neither read nor write the metadata cache (~/.video_sentinel_cache.json)'
+    )
+
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -461,15 +762,51 @@ def main():
         help='Clear queue state and temp files from previous queue mode session'
     )
 
+    return parser
+
+
+def main():
+    """Main entry point for VideoSentinel CLI"""
+    # Reset terminal to normal mode at startup (in case previous run left it in cbreak mode).
+    # Non-TTY runs (cron, pipes) skip this entirely, and a terminal that is
+    # already in normal mode is only read, not rewritten.
+    if sys.stdin.isatty():
+        try:
+            import termios
+            fd = sys.stdin.fileno()
+            # Get current settings
+            try:
+                attrs = termios.tcgetattr(fd)
+                # Enable canonical mode (ICANON) and echo (ECHO) for normal line-buffered input
+                # This reverses cbreak/raw mode settings
+                normal_flags = termios.ICANON | termios.ECHO
+                if attrs[3] & normal_flags != normal_flags:  # lflag
+                    attrs[3] |= normal_flags
+                    termios.tcsetattr(fd, termios.TCSANOW, attrs)
+            except:
+                pass
+        except ImportError:
+            # On Windows or systems without termios, skip
+            pass
+
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Validate --parallel flag
     if args.parallel < 1:
         console.print("[error]Error: --parallel must be at least 1[/error]", highlight=False)
         sys.exit(1)
+    if args.jobs is not None and args.jobs < 1:
+        console.print("[error]Error: --jobs must be at least 1[/error]", highlight=False)
+        sys.exit(1)
+    jobs = args.jobs or available_cpu_count()
 
     # Handle --clear-queue flag (can be used standalone)
     if args.clear_queue:
+        # Mode-specific modules are imported in the branch that uses them, so
+        # runs that don't need them (and --help) skip loading them
+        from network_queue_manager import NetworkQueueManager
+
         section_header("CLEARING QUEUE STATE")
 
         queue_manager = NetworkQueueManager(
@@ -486,11 +823,20 @@ def main():
         else:
             console.print(f"No state file found at: {state_file}")
 
-        # Count and remove temp files
-        temp_files = list(temp_dir.glob("*"))
-        if temp_files:
-            total_size = sum(f.stat().st_size for f in temp_files if f.is_file())
-            console.print(f"Removing {len(temp_files)} temp files ([info]{total_size / (1024**2):.2f}[/info] MB)")
+        # Count and remove temp files. scandir reports the entry type from the
+        # directory listing, so only regular files cost a stat (for their size)
+        entry_count = 0
+        total_size = 0
+        try:
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
+                    entry_count += 1
+                    if entry.is_file():
+                        total_size += entry.stat().st_size
+        except OSError:
+            pass
+        if entry_count:
+            console.print(f"Removing {entry_count} temp files ([info]{total_size / (1024**2):.2f}[/info] MB)")
             queue_manager.cleanup()
             console.print("[success]\u2713 Queue cleared successfully[/success]")
         else:
@@ -572,8 +918,13 @@ def main():
     if args.stats:
         section_header("Video Library Statistics")
 
-        analyzer = VideoAnalyzer(verbose=args.verbose)
-        stats_collector = StatsCollector(analyzer)
+        from stats import StatsCollector
+        analyzer = VideoAnalyzer(
+            verbose=args.verbose,
+            use_cache=not args.no_cache,
+            refresh_cache=args.refresh_metadata
+        )
+        stats_collector = StatsCollector(analyzer, workers=jobs)
 
         for path in args.paths:
             console.print(f"Processing path: {path}")
@@ -588,73 +939,88 @@ def main():
     # Check ffmpeg availability
     encoder = VideoEncoder(verbose=args.verbose, recovery_mode=args.recover,
                            downscale_1080p=args.downscale_1080p, parallel=args.parallel,
-                           profile=args.profile)
+                           profile=args.profile, hwaccel=args.hwaccel)
     if not encoder.check_ffmpeg_available():
         console.print("[error]Error: ffmpeg is not installed or not in PATH[/error]", highlight=False)
         console.print("[error]Please install ffmpeg to use VideoSentinel[/error]", highlight=False)
         sys.exit(1)
 
-    section_header("VideoSentinel - Video Library Manager")
-
-    if args.paths:
-        console.print(f"Processing {len(args.paths)} paths:")
-        for path in args.paths:
-            console.print(f"  - {path}")
-        console.print(f"Recursive scan: {args.recursive}")
-    elif args.file_list:
-        console.print(f"Processing videos from file list: {args.file_list}")
-    else:
-        console.print("No specific paths or file list provided for processing (e.g., --clear-queue was used).")
-
-    console.print(f"Target codec: [codec]{args.target_codec.upper()}[/codec]")
-    if args.profile:
-        profile_info = VideoEncoder.PROFILES[args.profile]
-        console.print(f"Profile: [codec]{args.profile}[/codec] — {profile_info['description']}")
-        if args.target_codec != 'hevc':
-            console.print(
-                f"[warning]Note: the {args.profile} profile's x265 tuning only "
-                f"applies to HEVC; CRF and preset still apply to "
-                f"{args.target_codec.upper()}[/warning]"
-            )
-    console.print()
+    # Emit the run banner as one terminal write (Rich buffers inside `with console`)
+    with console:
+        section_header("VideoSentinel - Video Library Manager")
+
+        if args.paths:
+            console.print(f"Processing {len(args.paths)} paths:")
+            for path in args.paths:
+                console.print(f"  - {path}")
+            console.print(f"Recursive scan: {args.recursive}")
+        elif args.file_list:
+            console.print(f"Processing videos from file list: {args.file_list}")
+        else:
+            console.print("No specific paths or file list provided for processing (e.g., --clear-queue was used).")
+
+        console.print(f"Target codec: [codec]{args.target_codec.upper()}[/codec]")
+        if args.hwaccel != 'none' and (args.re_encode or args.fix_quicklook):
+            console.print(f"Video encoder: [codec]{encoder.resolve_video_encoder(args.target_codec)}[/codec]")
+        if args.profile:
+            profile_info = VideoEncoder.PROFILES[args.profile]
+            console.print(f"Profile: [codec]{args.profile}[/codec] — {profile_info['description']}")
+            if args.target_codec != 'hevc':
+                console.print(
+                    f"[warning]Note: the {args.profile} profile's x265 tuning only "
+                    f"applies to HEVC; CRF and preset still apply to "
+                    f"{args.target_codec.upper()}[/warning]"
+                )
+        console.print()
 
     # Initialize components
     # If downscale_1080p enabled, mark videos >1080p as non-compliant
     max_resolution = (1920, 1080) if args.downscale_1080p else None
-    analyzer = VideoAnalyzer(verbose=args.verbose, max_resolution=max_resolution)
-    duplicate_detector = DuplicateDetector(verbose=args.verbose)
-    issue_detector = IssueDetector(verbose=args.verbose)
+    analyzer = VideoAnalyzer(
+        verbose=args.verbose,
+        max_resolution=max_resolution,
+        use_cache=not args.no_cache,
+        refresh_cache=args.refresh_metadata
+    )
 
     # Parse file types filter if specified
     file_types_filter = None
     if args.file_types:
-        file_types_filter = [
+        # dict.fromkeys drops repeats ("mp4,MP4,.mp4") while keeping the given order
+        file_types_filter = list(dict.fromkeys(
             ext.strip().lower().lstrip('.')
             for ext in args.file_types.split(',')
-        ]
+            if ext.strip()
+        ))
         console.print(f"File type filter: {', '.join(file_types_filter).upper()}")
 
-    # Find all video files from the provided paths or file list
+    # Find all video files from the provided paths or file list.
+    # For re-encoding and quicklook fix operations, max-files limit is applied
+    # AFTER filtering to files that need processing (smarter behavior).
+    # For other operations it applies here, and discovery stops once it's met.
+    # Discovery collects one file past the limit, so the limit message only
+    # shows when files were actually left out.
+    discovery_limit = None
+    if args.max_files and not args.re_encode and not args.fix_quicklook:
+        discovery_limit = args.max_files + 1
+
     video_files = []
     if args.file_list:
         console.print(f"Reading video paths from: {args.file_list}")
         try:
-            with open(args.file_list, 'r') as f:
-                for line in f:
-                    path_str = line.strip()
-                    if path_str:
-                        video_path = Path(path_str)
-                        if video_path.exists() and video_path.is_file() and video_path.suffix.lower() in analyzer.VIDEO_EXTENSIONS:
-                            video_files.append(video_path)
-                        else:
-                            if args.verbose:
-                                console.print(f"Skipping invalid or non-video entry in file list: {path_str}", style="dim")
+            listed = iter_file_list(args.file_list, analyzer.VIDEO_EXTENSIONS, verbose=args.verbose)
+            if discovery_limit:
+                # Stop reading (and stat'ing) the list once enough entries are found
+                listed = islice(listed, discovery_limit)
+            video_files.extend(listed)
         except Exception as e:
             console.print(f"[error]Error reading file list '{args.file_list}': {e}[/error]", highlight=False)
             sys.exit(1)
     elif args.paths:
         console.print("Finding video files...")
         for path in args.paths:
+            if discovery_limit and len(video_files) >= discovery_limit:
+                break
             if path.is_file():
                 if path.suffix.lower() in analyzer.VIDEO_EXTENSIONS:
                     video_files.append(path)
@@ -665,14 +1031,12 @@ def main():
                 video_files.extend(analyzer.find_videos(
                     path,
                     recursive=args.recursive,
-                    file_types=file_types_filter
+                    file_types=file_types_filter,
+                    max_files=discovery_limit - len(video_files) if discovery_limit else None
                 ))
 
-    # Note: For re-encoding and quicklook fix operations, max-files limit is applied
-    # AFTER filtering to files that need processing (smarter behavior).
-    # For other operations, apply it here.
-    if args.max_files and not args.re_encode and not args.fix_quicklook and len(video_files) > args.max_files:
-        console.print(f"Limiting to first {args.max_files} files (found {len(video_files)} total)")
+    if discovery_limit and len(video_files) > args.max_files:
+        console.print(f"Limiting to first {args.max_files} files")
         video_files = video_files[:args.max_files]
 
     if not video_files:
@@ -687,15 +1051,30 @@ def main():
 
     # Create samples if requested
     if args.create_samples:
+        from sample_generator import create_sample_video
         section_header("CREATING SAMPLE VIDEOS")
 
         with create_scan_progress() as progress:
-            task = progress.add_task("Generating samples", total=len(video_files))
-            for video_path in video_files:
-                video_info = analyzer.get_video_info(video_path)
-                if video_info and video_info.is_valid:
-                    create_sample_video(video_info)
-                progress.advance(task)
+            # Probe concurrently, then keep the first video of each
+            # resolution/codec permutation: create_sample_video writes one
+            # sample per permutation, and deduplicating here means no two
+            # workers ever encode the same sample.
+            probe_task = progress.add_task("Analyzing videos", total=len(video_files))
+            samples = {}
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                for video_info in executor.map(analyzer.get_video_info, video_files):
+                    if video_info and video_info.is_valid:
+                        samples.setdefault((video_info.width, video_info.height, video_info.codec), video_info)
+                    progress.advance(probe_task)
+
+            # Each sample is an ffmpeg encode; run half as many as there are
+            # cores so concurrent encoders don't starve each other
+            task = progress.add_task("Generating samples", total=len(samples))
+            sample_workers = max(1, available_cpu_count() // 2)
+            with ThreadPoolExecutor(max_workers=sample_workers) as executor:
+                futures = [executor.submit(create_sample_video, info) for info in samples.values()]
+                for _ in as_completed(futures):
+                    progress.advance(task)
 
         analyzer.save_cache()
         console.print("\nSample creation process complete.")
@@ -717,6 +1096,7 @@ def main():
         console.print()
 
         if args.queue_mode:
+            from network_queue_manager import NetworkQueueManager
             console.print("[bold]QUEUE MODE ENABLED[/bold]")
             queue_manager = NetworkQueueManager(
                 temp_dir=args.temp_dir,
@@ -750,30 +1130,38 @@ def main():
             with create_batch_progress() as progress:
                 overall = progress.add_task("Remuxing MKV files", total=len(videos_to_remux))
                 current = progress.add_task("", total=None)
-                for video_path in videos_to_remux:
-                    progress.update(current, description=fit_filename(video_path.name))
-                    output_path = video_path.with_suffix('.mp4')
-
-                    if output_path == video_path:
-                        remux_results[video_path] = 'skipped'
-                        progress.advance(overall)
-                        continue
-
-                    result = encoder.remux_to_mp4(video_path, output_path)
-
-                    if result:
-                        if args.replace_original:
-                            try:
-                                video_path.unlink()
-                                remux_results[video_path] = 'replaced'
-                            except Exception as e:
-                                remux_results[video_path] = f'delete_failed: {e}'
+                name_width = description_width()
+                # Remuxing is a stream copy, bound by disk rather than CPU, so
+                # a few concurrent ffmpeg processes keep the disk busy through
+                # each one's startup and container parsing. Originals are only
+                # deleted here on the main thread, after their remux finished.
+                with ThreadPoolExecutor(max_workers=max(1, args.remux_jobs)) as executor:
+                    futures = {}
+                    for video_path in videos_to_remux:
+                        output_path = video_path.with_suffix('.mp4')
+                        if output_path == video_path:
+                            remux_results[video_path] = 'skipped'
+                            progress.advance(overall)
+                            continue
+                        futures[executor.submit(encoder.remux_to_mp4, video_path, output_path)] = video_path
+
+                    for future in as_completed(futures):
+                        video_path = futures[future]
+                        progress.update(current, description=fit_filename(video_path.name, name_width))
+
+                        if future.result():
+                            if args.replace_original:
+                                try:
+                                    video_path.unlink()
+                                    remux_results[video_path] = 'replaced'
+                                except Exception as e:
+                                    remux_results[video_path] = f'delete_failed: {e}'
+                            else:
+                                remux_results[video_path] = 'created'
                         else:
-                            remux_results[video_path] = 'created'
-                    else:
-                        remux_results[video_path] = 'failed'
+                            remux_results[video_path] = 'failed'
 
-                    progress.advance(overall)
+                        progress.advance(overall)
 
             # Print summary
             succeeded = sum(1 for v in remux_results.values() if v in ('replaced', 'created'))
@@ -783,6 +1171,10 @@ def main():
         console.print("\nForce remux complete.")
         sys.exit(0)
 
+    # Metadata probed by the spec check, reused by later passes so each file
+    # is only ffprobed once per run
+    video_infos: Dict[Path, VideoInfo] = {}
+
     # Check encoding specifications
     if args.check_specs:
         section_header("ENCODING SPECIFICATION CHECK")
@@ -791,18 +1183,23 @@ def main():
         non_compliant_videos = []
         failed_analyses = []
 
-        with create_batch_progress() as progress:
+        # Probe in a thread pool (each probe is an ffprobe subprocess) but
+        # classify in submission order so results match a sequential scan.
+        with create_batch_progress() as progress, ThreadPoolExecutor(max_workers=jobs) as executor:
             overall = progress.add_task("Analyzing videos", total=len(video_files))
             current = progress.add_task("", total=None)
-            for video_path in video_files:
-                progress.update(current, description=fit_filename(video_path.name))
-                video_info = analyzer.get_video_info(video_path)
+            name_width = description_width()
+            futures = [executor.submit(analyzer.get_video_info, p) for p in video_files]
+            for video_path, future in zip(video_files, futures):
+                progress.update(current, description=fit_filename(video_path.name, name_width))
+                video_info = future.result()
 
                 if not video_info or not video_info.is_valid:
                     failed_analyses.append(video_path)
                     progress.advance(overall)
                     continue
 
+                video_infos[video_path] = video_info
                 is_compliant = analyzer.meets_modern_specs(video_info)
 
                 if is_compliant:
@@ -812,6 +1209,7 @@ def main():
 
                     # Early exit: if re-encoding with max-files, stop once we have enough non-compliant videos
                     if args.re_encode and args.max_files and len(non_compliant_videos) >= args.max_files * 2:
+                        executor.shutdown(cancel_futures=True)
                         break
 
                 progress.advance(overall)
@@ -825,18 +1223,20 @@ def main():
 
         if non_compliant_videos:
             console.print()
-            console.print("[error]Non-compliant videos:[/error]")
+            # One print for the whole list; Rich renders and flushes per call
+            lines = ["[error]Non-compliant videos:[/error]"]
             for video_path, video_info in non_compliant_videos:
-                codec_lower = video_info.codec.lower()
-                codec_ok = codec_lower in analyzer.MODERN_CODECS
-                codec_str = f"[success]{video_info.codec.upper()}[/success]" if codec_ok else f"[error]{video_info.codec.upper()}[/error]"
-                console.print(f"  [error]\u2717[/error] {video_path.name}  {codec_str}  [info]{video_info.width}x{video_info.height}[/info]  {video_info.container}")
+                codec_style = "success" if video_info.codec_lower in analyzer.MODERN_CODECS else "error"
+                codec_str = f"[{codec_style}]{video_info.codec.upper()}[/{codec_style}]"
+                lines.append(f"  [error]\u2717[/error] {video_path.name}  {codec_str}  [info]{video_info.width}x{video_info.height}[/info]  {video_info.container}")
+            console.print("\n".join(lines))
 
         if failed_analyses:
             console.print()
-            console.print("[warning]Videos that couldn't be analyzed:[/warning]")
-            for video_path in failed_analyses:
-                console.print(f"  {video_path}")
+            console.print("\n".join(
+                ["[warning]Videos that couldn't be analyzed:[/warning]"]
+                + [f"  {video_path}" for video_path in failed_analyses]
+            ))
 
         console.print()
 
@@ -858,12 +1258,27 @@ def main():
             videos_needing_encode = []
             videos_already_encoded = []
 
-            with create_batch_progress() as progress:
+            # Lookups are stat/ffprobe-bound (often on a network share), so
+            # overlap them in a pool but consume results in submission order
+            with create_batch_progress() as progress, ThreadPoolExecutor(max_workers=jobs) as executor:
                 overall = progress.add_task("Checking for existing outputs", total=len(non_compliant_videos))
                 current = progress.add_task("", total=None)
-                for video_path, video_info in non_compliant_videos:
-                    progress.update(current, description=fit_filename(video_path.name))
-                    existing_output = encoder.find_existing_output(video_path, target_codec=args.target_codec)
+                name_width = description_width()
+                dir_listings = list_directories(
+                    (video_path.parent for video_path, _ in non_compliant_videos), executor
+                )
+                futures = [
+                    executor.submit(
+                        encoder.find_existing_output,
+                        video_path,
+                        target_codec=args.target_codec,
+                        dir_names=dir_listings.get(video_path.parent)
+                    )
+                    for video_path, _ in non_compliant_videos
+                ]
+                for (video_path, video_info), future in zip(non_compliant_videos, futures):
+                    progress.update(current, description=fit_filename(video_path.name, name_width))
+                    existing_output = future.result()
 
                     if existing_output:
                         videos_already_encoded.append((video_path, existing_output))
@@ -871,6 +1286,7 @@ def main():
                         videos_needing_encode.append((video_path, video_info))
 
                         if args.max_files and len(videos_needing_encode) >= args.max_files:
+                            executor.shutdown(cancel_futures=True)
                             break
 
                     progress.advance(overall)
@@ -906,6 +1322,7 @@ def main():
                     do_replace = args.replace_original or args.replace_after_review
 
                     # Initialize queue manager
+                    from network_queue_manager import NetworkQueueManager
                     queue_manager = NetworkQueueManager(
                         temp_dir=args.temp_dir,
                         max_buffer_size=args.buffer_size,
@@ -939,20 +1356,23 @@ def main():
                     # Create encoding callback
                     total = len(videos_to_encode)
 
+                    # Callbacks only see the local temp copy, so look infos up
+                    # by original file name (first path wins on a name clash; a size
+                    # mismatch on the copy makes the callback probe it instead)
+                    infos_by_name = {}
+                    for orig_path, info in video_infos_dict.items():
+                        infos_by_name.setdefault(orig_path.name, info)
+
                     def encode_callback(local_input: Path, local_output: Path, progress=None, file_task=None) -> bool:
                         """Callback for encoding a single video in queue mode"""
                         # Find the original network path for this file
                         # (local_input is a temp file, need to find which video it corresponds to)
-                        video_info = None
-
-                        # Try to find matching video_info by filename
-                        for orig_path, info in video_infos_dict.items():
-                            if orig_path.name == local_input.name or local_input.name.startswith('download_'):
-                                # Check if the downloaded file matches
-                                check_name = local_input.name.replace('download_', '')
-                                if orig_path.name == check_name:
-                                    video_info = info
-                                    break
+                        # Downloads are saved as download_<original name>
+                        video_info = _info_for_copy(
+                            infos_by_name.get(local_input.name.removeprefix('download_')),
+                            local_input,
+                            analyzer
+                        )
 
                         # Encode the video, passing progress handle for in-place updates
                         result = encoder.re_encode_video(
@@ -1072,12 +1492,24 @@ def main():
             videos_to_remux = []
             videos_to_reencode = []
 
-            with create_batch_progress() as progress:
+            # Spec-check infos usually answer this without a subprocess, but
+            # entries cached before the raw stream fields were stored need an
+            # ffprobe each, so run the checks in a pool and consume in order
+            with create_batch_progress() as progress, ThreadPoolExecutor(max_workers=jobs) as executor:
                 overall = progress.add_task("Checking QuickLook compatibility", total=len(compliant_videos))
                 current = progress.add_task("", total=None)
-                for video_path in compliant_videos:
-                    progress.update(current, description=fit_filename(video_path.name))
-                    compat = analyzer.check_quicklook_compatibility(video_path)
+                name_width = description_width()
+                futures = [
+                    executor.submit(
+                        analyzer.check_quicklook_compatibility,
+                        video_path,
+                        video_info=video_infos.get(video_path)
+                    )
+                    for video_path in compliant_videos
+                ]
+                for video_path, future in zip(compliant_videos, futures):
+                    progress.update(current, description=fit_filename(video_path.name, name_width))
+                    compat = future.result()
 
                     if compat['needs_remux']:
                         videos_to_remux.append(video_path)
@@ -1101,22 +1533,33 @@ def main():
                 videos_already_fixed = []
 
                 all_videos_to_check = videos_to_remux + videos_to_reencode
+                remux_set = set(videos_to_remux)
 
-                with create_batch_progress() as progress:
+                with create_batch_progress() as progress, ThreadPoolExecutor(max_workers=jobs) as executor:
                     overall = progress.add_task("Checking for existing outputs", total=len(all_videos_to_check))
                     current = progress.add_task("", total=None)
-                    for video_path in all_videos_to_check:
-                        progress.update(current, description=fit_filename(video_path.name))
-                        existing_output = encoder.find_existing_output(
+                    name_width = description_width()
+                    dir_listings = list_directories(
+                        (video_path.parent for video_path in all_videos_to_check), executor
+                    )
+                    futures = [
+                        executor.submit(
+                            encoder.find_existing_output,
                             video_path,
                             target_codec=args.target_codec,
-                            check_suffixes=['_quicklook', '_reencoded']
+                            check_suffixes=['_quicklook', '_reencoded'],
+                            dir_names=dir_listings.get(video_path.parent)
                         )
+                        for video_path in all_videos_to_check
+                    ]
+                    for video_path, future in zip(all_videos_to_check, futures):
+                        progress.update(current, description=fit_filename(video_path.name, name_width))
+                        existing_output = future.result()
 
                         if existing_output:
                             videos_already_fixed.append((video_path, existing_output))
                         else:
-                            if video_path in videos_to_remux:
+                            if video_path in remux_set:
                                 videos_remux_needed.append(video_path)
                             else:
                                 videos_reencode_needed.append(video_path)
@@ -1157,6 +1600,7 @@ def main():
                     "  3. UPLOAD: Local \u2192 Network")
 
                 # Initialize queue manager
+                from network_queue_manager import NetworkQueueManager
                 queue_manager = NetworkQueueManager(
                     temp_dir=args.temp_dir,
                     max_buffer_size=args.buffer_size,
@@ -1187,6 +1631,13 @@ def main():
                     console.print()
 
                 # Create processing callback
+                remux_names = {path.name for path in videos_to_remux}
+                # The temp copy is byte-identical to the original, so reuse the
+                # spec check's metadata rather than probing the download again
+                reencode_infos = {}
+                for path in videos_to_reencode:
+                    reencode_infos.setdefault(path.name, video_infos.get(path))
+
                 def quicklook_fix_callback(local_input: Path, local_output: Path, progress=None, file_task=None) -> bool:
                     """Callback for fixing QuickLook compatibility in queue mode"""
                     # Find the original network path to determine if remux or re-encode
@@ -1195,18 +1646,13 @@ def main():
                     video_info = None
 
                     # Check if this file needs remux or re-encode
-                    for orig_path in videos_to_remux:
-                        check_name = local_input.name.replace('download_', '')
-                        if orig_path.name == check_name:
-                            needs_remux = True
-                            break
-
-                    for orig_path in videos_to_reencode:
-                        check_name = local_input.name.replace('download_', '')
-                        if orig_path.name == check_name:
-                            needs_reencode = True
-                            video_info = analyzer.get_video_info(local_input)
-                            break
+                    # (downloads are saved as download_<original name>)
+                    check_name = local_input.name.removeprefix('download_')
+                    if check_name in remux_names:
+                        needs_remux = True
+                    if check_name in reencode_infos:
+                        needs_reencode = True
+                        video_info = _info_for_copy(reencode_infos[check_name], local_input, analyzer)
 
                     # Process based on what's needed
                     if needs_remux:
@@ -1302,22 +1748,44 @@ def main():
                 if videos_to_remux:
                     section_header("REMUXING FOR QUICKLOOK COMPATIBILITY (FAST)")
 
-                    for video_path in videos_to_remux:
-                        output_path = video_path.parent / f"{video_path.stem}_quicklook.mp4"
-
-                        console.print(f"Remuxing: {video_path.name}")
-                        result = encoder.remux_to_mp4(video_path, output_path)
-
-                        if result:
+                    def remux_same_stem(videos: List[Path]) -> List[tuple]:
+                        """Remux (and optionally swap in) videos sharing one output path, in order"""
+                        results = []
+                        for video_path in videos:
+                            output_path = video_path.parent / f"{video_path.stem}_quicklook.mp4"
+                            if not encoder.remux_to_mp4(video_path, output_path):
+                                results.append((video_path, output_path, False, None))
+                                continue
+                            error = None
                             if args.replace_original:
-                                # Delete original and rename output
-                                video_path.unlink()
-                                output_path.rename(video_path.with_suffix('.mp4'))
-                                console.print(f"[success]\u2713 Replaced: {video_path.name} \u2192 {video_path.stem}.mp4[/success]")
-                            else:
-                                console.print(f"[success]\u2713 Created: {output_path.name}[/success]")
-                        else:
-                            console.print(f"[error]\u2717 Failed: {video_path.name}[/error]")
+                                try:
+                                    _replace_with_output(video_path, output_path)
+                                except OSError as e:
+                                    error = e
+                            results.append((video_path, output_path, True, error))
+                        return results
+
+                    # Remuxes are stream copies, so several run at once. Videos
+                    # with the same stem (clip.avi, clip.mkv) share the
+                    # _quicklook and .mp4 paths, so each such set runs in order
+                    # on one worker; results are reported as they finish.
+                    by_output = {}
+                    for video_path in videos_to_remux:
+                        by_output.setdefault(video_path.with_suffix(''), []).append(video_path)
+
+                    console.print(f"Remuxing {len(videos_to_remux)} videos...")
+                    with ThreadPoolExecutor(max_workers=max(1, args.remux_jobs)) as executor:
+                        futures = [executor.submit(remux_same_stem, videos) for videos in by_output.values()]
+                        for future in as_completed(futures):
+                            for video_path, output_path, succeeded, error in future.result():
+                                if not succeeded:
+                                    console.print(f"[error]\u2717 Failed: {video_path.name}[/error]")
+                                elif error is not None:
+                                    console.print(f"[error]\u2717 Failed to replace {video_path.name}: {error}[/error]")
+                                elif args.replace_original:
+                                    console.print(f"[success]\u2713 Replaced: {video_path.name} \u2192 {video_path.stem}.mp4[/success]")
+                                else:
+                                    console.print(f"[success]\u2713 Created: {output_path.name}[/success]")
 
                     console.print()
 
@@ -1357,6 +1825,11 @@ def main():
 
     # Find duplicates
     if args.find_duplicates or args.filename_duplicates:
+        # Imported here: OpenCV, NumPy and imagehash make this the slowest
+        # module to load, and no other mode needs it
+        from duplicate_detector import DuplicateDetector
+        duplicate_detector = DuplicateDetector(verbose=args.verbose, workers=jobs, hw_decode=args.hw_decode)
+
         # Stop shutdown listener to restore normal terminal mode for input prompts
         stop_shutdown_listener()
 
@@ -1371,14 +1844,34 @@ def main():
 
         # Use filename-based detection if requested, otherwise use perceptual hashing
         failed_videos = []
+        # Metadata for duration matching, file sizes and every duplicate group
+        # below. The spec check's results are still current unless a pass
+        # above replaced originals in place; anything missing is probed here.
+        probed_infos: Dict[Path, VideoInfo] = {}
+        if not (args.replace_original or args.replace_after_review):
+            probed_infos.update(video_infos)
         if args.filename_duplicates:
             duplicate_groups = duplicate_detector.find_duplicates_by_filename(
                 video_files,
                 analyzer=analyzer,
-                check_duration=not args.ignore_duration
+                check_duration=not args.ignore_duration,
+                video_infos=probed_infos
             )
         else:
-            duplicate_groups, failed_videos = duplicate_detector.find_duplicates(video_files)
+            # Videos of different lengths can't match, so known durations let the
+            # detector skip hashing videos that have no length-compatible partner.
+            durations = None
+            if not args.ignore_duration:
+                unprobed = [video for video in video_files if video not in probed_infos]
+                with ThreadPoolExecutor(max_workers=jobs) as executor:
+                    infos = executor.map(analyzer.get_video_info, unprobed)
+                    probed_infos.update(
+                        (video, info)
+                        for video, info in zip(unprobed, infos)
+                        if info and info.is_valid
+                    )
+                durations = {video: info.duration for video, info in probed_infos.items()}
+            duplicate_groups, failed_videos = duplicate_detector.find_duplicates(video_files, durations=durations)
 
         # Save cache after bulk probing during duplicate detection
         analyzer.save_cache()
@@ -1399,12 +1892,27 @@ def main():
             # Map deleted files to their corresponding kept file for space calculation
             delete_to_keep_map = {}
 
+            # One size index for the report, the per-group rankings and the
+            # deletion summary, so no file is stat'ed twice. Probed videos
+            # already carry their size (cached entries are validated against
+            # it), so only the rest need a stat.
+            file_sizes = {}
+            unsized = []
+            for videos in duplicate_groups.values():
+                for video in videos:
+                    info = probed_infos.get(video)
+                    if info and info.file_size > 0:
+                        file_sizes[video] = info.file_size
+                    else:
+                        unsized.append(video)
+            file_sizes.update(collect_file_sizes(unsized, max_workers=jobs))
+
             if args.duplicate_action == 'report':
                 # Just report duplicates, no action
                 for group_name, videos in duplicate_groups.items():
                     console.print(f"{group_name} ({len(videos)} videos):")
                     for video in videos:
-                        file_size_mb = video.stat().st_size / (1024 * 1024)
+                        file_size_mb = file_sizes.get(video, 0) / (1024 * 1024)
                         console.print(f"  - {video.name} ([info]{file_size_mb:.2f}[/info] MB)")
                     console.print()
             else:
@@ -1416,8 +1924,13 @@ def main():
                         videos,
                         analyzer,
                         args.duplicate_action,
-                        args.verbose
+                        args.verbose,
+                        file_sizes=file_sizes,
+                        info_cache=probed_infos
                     )
+                    if to_delete is None:
+                        # Review stopped; groups decided so far are still applied
+                        break
                     all_to_delete.extend(to_delete)
                     if to_keep:
                         all_to_keep.append(to_keep)
@@ -1432,103 +1945,61 @@ def main():
 
                     if args.duplicate_action == 'auto-best':
                         # Auto mode - delete immediately
-                        confirm = input(f"\nDelete {len(all_to_delete)} files? (yes/no): ").strip('\r\n\t ').replace('\r', '').replace('\n', '').lower()
+                        confirm = input(f"\nDelete {len(all_to_delete)} files? (yes/no): ").translate(_STRIP_WS).lower()
                         if confirm == 'yes':
-                            deleted_count = 0
-                            total_size_freed = 0
-                            incremental_space_saved = 0
-
-                            for video in all_to_delete:
-                                try:
-                                    deleted_size = video.stat().st_size
-                                    video.unlink()
-                                    deleted_count += 1
-                                    total_size_freed += deleted_size
-
-                                    # Calculate incremental space saved (deleted - kept)
-                                    if video in delete_to_keep_map:
-                                        kept_file = delete_to_keep_map[video]
-                                        if kept_file.exists():
-                                            kept_size = kept_file.stat().st_size
-                                            incremental_space_saved += max(0, deleted_size - kept_size)
-                                        else:
-                                            incremental_space_saved += deleted_size
-                                    else:
-                                        incremental_space_saved += deleted_size
-
-                                    console.print(f"  [success]\u2713[/success] Deleted: {video.name}")
-                                except Exception as e:
-                                    console.print(f"  [error]\u2717[/error] Failed to delete {video.name}: {e}")
-
-                            console.print()
-                            console.print(f"Successfully deleted {deleted_count}/{len(all_to_delete)} files")
-                            console.print(f"Total space freed: [info]{total_size_freed / (1024*1024):.2f}[/info] MB")
-                            compaction_pct = (incremental_space_saved / total_size_freed * 100) if total_size_freed > 0 else 0
-                            console.print(f"Incremental space saved: [info]{incremental_space_saved / (1024*1024):.2f}[/info] MB ([info]{compaction_pct:.1f}%[/info] compaction)")
+                            _perform_deletions(all_to_delete, delete_to_keep_map, file_sizes, max_workers=jobs)
                         else:
                             console.print(f"[warning]\u2192 Deletion cancelled[/warning]")
                     else:
                         # Interactive mode - already got confirmation per group, delete now
-                        deleted_count = 0
-                        total_size_freed = 0
-                        incremental_space_saved = 0
-
-                        for video in all_to_delete:
-                            try:
-                                deleted_size = video.stat().st_size
-                                video.unlink()
-                                deleted_count += 1
-                                total_size_freed += deleted_size
-
-                                # Calculate incremental space saved (deleted - kept)
-                                if video in delete_to_keep_map:
-                                    kept_file = delete_to_keep_map[video]
-                                    if kept_file.exists():
-                                        kept_size = kept_file.stat().st_size
-                                        incremental_space_saved += max(0, deleted_size - kept_size)
-                                    else:
-                                        incremental_space_saved += deleted_size
-                                else:
-                                    incremental_space_saved += deleted_size
-
-                                console.print(f"  [success]\u2713[/success] Deleted: {video.name}")
-                            except Exception as e:
-                                console.print(f"  [error]\u2717[/error] Failed to delete {video.name}: {e}")
-
-                        console.print()
-                        console.print(f"Successfully deleted {deleted_count}/{len(all_to_delete)} files")
-                        console.print(f"Total space freed: [info]{total_size_freed / (1024*1024):.2f}[/info] MB")
-                        compaction_pct = (incremental_space_saved / total_size_freed * 100) if total_size_freed > 0 else 0
-                        console.print(f"Incremental space saved: [info]{incremental_space_saved / (1024*1024):.2f}[/info] MB ([info]{compaction_pct:.1f}%[/info] compaction)")
+                        _perform_deletions(all_to_delete, delete_to_keep_map, file_sizes, max_workers=jobs)
                     console.print()
 
                     # Clean up filenames of kept files (remove _reencoded and _quicklook suffixes)
                     if all_to_keep:
                         section_header("CLEANING UP FILENAMES")
 
+                        # Strip the _reencoded/_quicklook suffix from kept files that have one
+                        rename_plan = [
+                            (video, video.parent / (video.stem[:-length] + video.suffix))
+                            for video in all_to_keep
+                            for suffix, length in _PROCESSED_SUFFIXES
+                            if video.stem.endswith(suffix)
+                        ]
+
+                        # Renames are independent round trips on network storage, so run
+                        # them concurrently; results are reported in plan order. Each
+                        # directory is listed once (after the deletions above) to check
+                        # for existing targets, rather than stat'ing every target.
                         renamed_count = 0
-                        for video in all_to_keep:
-                            # Check if filename has _reencoded or _quicklook suffix
-                            stem = video.stem
-                            if stem.endswith('_reencoded') or stem.endswith('_quicklook'):
-                                # Remove the suffix
-                                if stem.endswith('_reencoded'):
-                                    new_stem = stem[:-len('_reencoded')]
+                        with ThreadPoolExecutor(max_workers=jobs) as executor:
+                            dir_listings = list_directories(
+                                (new_path.parent for _, new_path in rename_plan), executor
+                            )
+                            claimed_targets = set()
+                            futures = []
+                            for video, new_path in rename_plan:
+                                if new_path in claimed_targets:
+                                    # An earlier file already takes this name; renaming
+                                    # both concurrently would let one overwrite the other
+                                    futures.append(None)
                                 else:
-                                    new_stem = stem[:-len('_quicklook')]
-
-                                new_path = video.parent / (new_stem + video.suffix)
-
-                                # Check if target path already exists
-                                if new_path.exists():
-                                    console.print(f"  [warning]\u26a0[/warning] Skipping {video.name}: {new_path.name} already exists")
-                                else:
-                                    try:
-                                        video.rename(new_path)
+                                    claimed_targets.add(new_path)
+                                    futures.append(executor.submit(
+                                        _rename_if_free, video, new_path,
+                                        dir_listings.get(new_path.parent)
+                                    ))
+
+                            with ConsoleBuffer() as out:
+                                for (video, new_path), future in zip(rename_plan, futures):
+                                    status, error = future.result() if future else ('skipped', None)
+                                    if status == 'renamed':
                                         renamed_count += 1
-                                        console.print(f"  [success]\u2713[/success] Renamed: {video.name} \u2192 {new_path.name}")
-                                    except Exception as e:
-                                        console.print(f"  [error]\u2717[/error] Failed to rename {video.name}: {e}")
+                                        out.print(f"  [success]\u2713[/success] Renamed: {video.name} \u2192 {new_path.name}")
+                                    elif status == 'skipped':
+                                        out.print(f"  [warning]\u26a0[/warning] Skipping {video.name}: {new_path.name} already exists")
+                                    else:
+                                        out.print(f"  [error]\u2717[/error] Failed to rename {video.name}: {error}")
 
                         if renamed_count > 0:
                             console.print()
@@ -1540,7 +2011,8 @@ def main():
                     console.print()
                     console.print(f"[warning]No duplicates marked for deletion[/warning]")
 
-            console.print(f"Total duplicates: {sum(len(v) for v in duplicate_groups.values())} videos in {len(duplicate_groups)} groups")
+            total_dups = sum(map(len, duplicate_groups.values()))
+            console.print(f"Total duplicates: {total_dups} videos in {len(duplicate_groups)} groups")
         else:
             console.print()
             console.print("No duplicate videos found.")
@@ -1549,55 +2021,79 @@ def main():
 
     # Check for issues
     if args.check_issues:
+        from issue_detector import IssueDetector
+        issue_detector = IssueDetector(verbose=args.verbose, cache=analyzer.cache)
+
         subtitle = "Deep scan mode: decoding entire videos" if args.deep_scan else None
         section_header("ENCODING ISSUE DETECTION", subtitle)
 
-        videos_with_issues = []
+        # Deep scans decode the whole file and ffmpeg threads each decode
+        # itself, so run at most half as many of those as there are cores.
+        scan_workers = jobs
+        if args.deep_scan:
+            scan_workers = min(jobs, max(1, available_cpu_count() // 2))
+
+        # As with duplicates, spec-check metadata is only current if no pass
+        # above replaced originals in place; otherwise every file is re-probed
+        known_infos = video_infos
+        if args.replace_original or args.replace_after_review:
+            known_infos = {}
 
         scan_desc = "Deep scanning videos" if args.deep_scan else "Checking for issues"
-        with create_batch_progress() as progress:
+        issues_by_index = {}
+        with create_batch_progress() as progress, ThreadPoolExecutor(max_workers=scan_workers) as executor:
             overall = progress.add_task(scan_desc, total=len(video_files))
             current = progress.add_task("", total=None)
-            for video_path in video_files:
-                progress.update(current, description=fit_filename(video_path.name))
-                issues = issue_detector.scan_video(video_path, deep_scan=args.deep_scan)
+            name_width = description_width()
+            futures = {}
+            for index, video_path in enumerate(video_files):
+                info = known_infos.get(video_path)
+                if info is not None and not args.deep_scan:
+                    # A quick scan with known metadata runs no subprocess, so
+                    # checking it inline beats a round trip through the pool
+                    issues = issue_detector.scan_video(video_path, info=info)
+                    if issues:
+                        issues_by_index[index] = issues
+                    progress.advance(overall)
+                else:
+                    futures[executor.submit(
+                        issue_detector.scan_video, video_path,
+                        deep_scan=args.deep_scan, info=info
+                    )] = index
+
+            for future in as_completed(futures):
+                index = futures[future]
+                progress.update(current, description=fit_filename(video_files[index].name, name_width))
+                issues = future.result()
 
                 if issues:
-                    videos_with_issues.append((video_path, issues))
+                    issues_by_index[index] = issues
 
                 progress.advance(overall)
 
-        # Print all issues after progress bar is gone
+        # Report in scan order regardless of which scans finished first
+        videos_with_issues = [
+            (video_files[index], issues_by_index[index])
+            for index in sorted(issues_by_index)
+        ]
+
+        # Print all issues after progress bar is gone, batched through one buffer
         if videos_with_issues:
             console.print()
-            for video_path, issues in videos_with_issues:
-                console.print(f"{video_path.name}:")
-                for issue in issues:
-                    severity_symbol = {
-                        'critical': '\u2717',
-                        'warning': '\u26a0',
-                        'info': '\u2139'
-                    }.get(issue.severity, '\u2022')
-
-                    severity_style = {
-                        'critical': 'error',
-                        'warning': 'warning',
-                        'info': 'info'
-                    }.get(issue.severity, '')
-
-                    console.print(f"  [{severity_style}]{severity_symbol} [{issue.severity.upper()}] {issue.issue_type}: {issue.description}[/{severity_style}]")
+            with ConsoleBuffer() as out:
+                for video_path, issues in videos_with_issues:
+                    out.print(f"{video_path.name}:")
+                    for issue in issues:
+                        severity_symbol = SEVERITY_SYMBOLS.get(issue.severity, '\u2022')
+                        severity_style = SEVERITY_STYLES.get(issue.severity, '')
+                        out.print(f"  [{severity_style}]{severity_symbol} [{issue.severity.upper()}] {issue.issue_type}: {issue.description}[/{severity_style}]")
 
         if videos_with_issues:
-            critical_count = sum(
-                1 for _, issues in videos_with_issues
-                for issue in issues
-                if issue.severity == 'critical'
-            )
-            warning_count = sum(
-                1 for _, issues in videos_with_issues
-                for issue in issues
-                if issue.severity == 'warning'
+            severity_counts = Counter(
+                issue.severity for _, issues in videos_with_issues for issue in issues
             )
+            critical_count = severity_counts['critical']
+            warning_count = severity_counts['warning']
 
             console.print()
             console.print(f"Summary: {len(videos_with_issues)} videos with issues")